@@ -1,13 +1,13 @@
 """CLI entry point for skill-eval."""
 
+import os
+import sys
 from pathlib import Path
 from typing import Optional
 
 import typer
 
 from skill_eval import __version__
-from skill_eval.logging import logger
-from skill_eval.selector import is_interactive, select_run, select_scenarios
 
 app = typer.Typer(help="A/B test skill variations against recorded scenarios.")
 
@@ -53,12 +53,39 @@ def _get_evals_dir(base_dir: Path | None = None) -> Path:
     return evals_dir
 
 
-def get_latest_run(runs_dir: Path, *, silent: bool = False) -> Path:
+def _list_subdirs(parent: Path) -> list[Path]:
+    """List non-hidden subdirectories of `parent` in a single scandir pass.
+
+    DirEntry caches the file type from the directory read, so no extra stat
+    is needed per entry (except for symlinks, which are followed).
+    """
+    with os.scandir(parent) as entries:
+        return [Path(e.path) for e in entries if not e.name.startswith(".") and e.is_dir()]
+
+
+def is_interactive() -> bool:
+    """Check if running in interactive mode (TTY).
+
+    Lives here rather than in `selector` so that checking doesn't import Textual.
+    """
+    return sys.stdin.isatty()
+
+
+def _list_runs(runs_dir: Path) -> list[str]:
+    """Names of run directories in `runs_dir`, in directory order."""
+    with os.scandir(runs_dir) as entries:
+        return [e.name for e in entries if not e.name.startswith(".") and e.is_dir()]
+
+
+def get_latest_run(
+    runs_dir: Path, *, silent: bool = False, run_names: list[str] | None = None
+) -> Path:
     """Get the most recent run directory.
 
     Args:
         runs_dir: Directory containing runs
         silent: If True, don't print the run name
+        run_names: Run names already listed from `runs_dir`, to skip listing it again
 
     Returns:
         Path to the most recent run directory
@@ -70,17 +97,17 @@ def get_latest_run(runs_dir: Path, *, silent: bool = False) -> Path:
         typer.echo("Error: No runs directory found", err=True)
         raise typer.Exit(1)
 
-    run_dirs = sorted(
-        [d for d in runs_dir.iterdir() if d.is_dir() and not d.name.startswith(".")],
-        reverse=True,
-    )
-    if not run_dirs:
+    # Run names are timestamps, so the lexically largest is the most recent
+    if run_names is None:
+        run_names = _list_runs(runs_dir)
+    latest = max(run_names, default=None)
+    if latest is None:
         typer.echo("Error: No runs found", err=True)
         raise typer.Exit(1)
 
     if not silent:
-        typer.echo(f"Using latest run: {run_dirs[0].name}")
-    return run_dirs[0]
+        typer.echo(f"Using latest run: {latest}")
+    return runs_dir / latest
 
 
 def find_run(runs_dir: Path, run_id: Optional[str], *, latest: bool = False) -> Path:
@@ -101,23 +128,29 @@ def find_run(runs_dir: Path, run_id: Optional[str], *, latest: bool = False) ->
         typer.echo("Error: No runs directory found", err=True)
         raise typer.Exit(1)
 
-    # Get all run directories
-    all_runs = [
-        d for d in runs_dir.iterdir() if d.is_dir() and not d.name.startswith(".")
-    ]
+    # Try exact match first; a full run ID needs a single stat, not a listing
+    if run_id:
+        exact_match = runs_dir / run_id
+        if os.path.isdir(exact_match):
+            return exact_match
 
-    if not all_runs:
+    # Get all run names; Paths are only built for runs we return or display
+    run_names = _list_runs(runs_dir)
+
+    if not run_names:
         typer.echo("Error: No runs found", err=True)
         raise typer.Exit(1)
 
     if run_id is None:
         # No run_id provided - decide behavior based on flags and interactivity
         if latest:
-            return get_latest_run(runs_dir)
+            return get_latest_run(runs_dir, run_names=run_names)
 
         if is_interactive():
-            # Show interactive selector
-            selected = select_run(all_runs, "Select a run")
+            # Show interactive selector (Textual is slow to import, so only now)
+            from skill_eval.selector import select_run
+
+            selected = select_run([runs_dir / name for name in run_names], "Select a run")
             if selected is None:
                 typer.echo("Selection cancelled", err=True)
                 raise typer.Exit(1)
@@ -125,24 +158,21 @@ def find_run(runs_dir: Path, run_id: Optional[str], *, latest: bool = False) ->
             return selected
         else:
             # Non-interactive: fall back to latest
-            return get_latest_run(runs_dir)
-
-    # Try exact match first
-    exact_match = runs_dir / run_id
-    if exact_match.exists() and exact_match.is_dir():
-        return exact_match
+            return get_latest_run(runs_dir, run_names=run_names)
 
     # Try partial match (contains)
-    matches = [d for d in all_runs if run_id in d.name]
+    matches = [name for name in run_names if run_id in name]
 
     if len(matches) == 1:
-        typer.echo(f"Matched run: {matches[0].name}")
-        return matches[0]
+        typer.echo(f"Matched run: {matches[0]}")
+        return runs_dir / matches[0]
     elif len(matches) > 1:
         # Multiple matches
         if is_interactive():
             # Show selector with only the matching runs
-            selected = select_run(matches, f"Multiple runs match '{run_id}'")
+            from skill_eval.selector import select_run
+
+            selected = select_run([runs_dir / m for m in matches], f"Multiple runs match '{run_id}'")
             if selected is None:
                 typer.echo("Selection cancelled", err=True)
                 raise typer.Exit(1)
@@ -150,18 +180,18 @@ def find_run(runs_dir: Path, run_id: Optional[str], *, latest: bool = False) ->
             return selected
         else:
             typer.echo(f"Error: '{run_id}' matches multiple runs:", err=True)
-            for m in sorted(matches, key=lambda d: d.name, reverse=True)[:10]:
-                typer.echo(f"  - {m.name}", err=True)
+            for m in sorted(matches, reverse=True)[:10]:
+                typer.echo(f"  - {m}", err=True)
             if len(matches) > 10:
                 typer.echo(f"  ... and {len(matches) - 10} more", err=True)
             raise typer.Exit(1)
     else:
         typer.echo(f"Error: No run matching '{run_id}'", err=True)
-        recent = sorted(all_runs, key=lambda d: d.name, reverse=True)[:5]
+        recent = sorted(run_names, reverse=True)[:5]
         if recent:
             typer.echo("Recent runs:", err=True)
             for r in recent:
-                typer.echo(f"  - {r.name}", err=True)
+                typer.echo(f"  - {r}", err=True)
         raise typer.Exit(1)
 
 
@@ -185,31 +215,24 @@ def find_scenarios(
         typer.echo("Error: No scenarios directory found", err=True)
         raise typer.Exit(1)
 
-    # Get all scenario directories (exclude only hidden dirs starting with .)
-    all_scenarios = [
-        d
-        for d in scenarios_dir.iterdir()
-        if d.is_dir() and not d.name.startswith(".")
-    ]
-
-    if not all_scenarios:
-        typer.echo("Error: No scenarios found", err=True)
-        raise typer.Exit(1)
-
-    if all_flag:
-        return sorted(all_scenarios, key=lambda d: d.name)
-
-    if names:
-        # Match provided names
+    if names and not all_flag:
+        # Match provided names; the directory is only listed if some name
+        # isn't an exact scenario name
         matched: list[Path] = []
+        listed: list[Path] | None = None
         for name in names:
             # Try exact match first
             exact = scenarios_dir / name
-            if exact.exists() and exact.is_dir():
+            if os.path.isdir(exact):
                 matched.append(exact)
                 continue
+            if listed is None:
+                listed = _list_subdirs(scenarios_dir)
+                if not listed:
+                    typer.echo("Error: No scenarios found", err=True)
+                    raise typer.Exit(1)
             # Try partial match
-            partial_matches = [d for d in all_scenarios if name in d.name]
+            partial_matches = [d for d in listed if name in d.name]
             if len(partial_matches) == 1:
                 matched.append(partial_matches[0])
             elif len(partial_matches) > 1:
@@ -222,9 +245,21 @@ def find_scenarios(
                 raise typer.Exit(1)
         return matched
 
+    # Get all scenario directories (exclude only hidden dirs starting with .)
+    all_scenarios = _list_subdirs(scenarios_dir)
+
+    if not all_scenarios:
+        typer.echo("Error: No scenarios found", err=True)
+        raise typer.Exit(1)
+
+    if all_flag:
+        return sorted(all_scenarios, key=lambda d: d.name)
+
     # No names provided - decide behavior based on interactivity
     if is_interactive():
         # Show interactive multi-selector
+        from skill_eval.selector import select_scenarios
+
         selected = select_scenarios(all_scenarios, "Select scenarios to run")
         if not selected:
             typer.echo("No scenarios selected", err=True)
@@ -243,6 +278,35 @@ def version_callback(value: bool) -> None:
         raise typer.Exit()
 
 
+def _open_urls(urls: list[str]) -> None:
+    """Open `urls` in the browser, launching it once when it takes several URLs.
+
+    Known Unix GUI browsers (Firefox, Chrome, ...) accept a list of URLs on
+    the command line; anything else (terminal browsers, which need the TTY,
+    xdg-open, macOS, Windows) gets one webbrowser.open call per URL.
+    """
+    import subprocess
+    import webbrowser
+
+    if len(urls) > 1:
+        try:
+            browser = webbrowser.get()
+        except webbrowser.Error:
+            browser = None
+        # webbrowser marks the browsers it runs detached with `background`
+        if isinstance(browser, webbrowser.UnixBrowser) and browser.background:
+            subprocess.Popen(
+                [browser.name, *urls],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                start_new_session=True,
+            )
+            return
+
+    for url in urls:
+        webbrowser.open(url)
+
+
 @app.callback()
 def main(
     version: bool = typer.Option(
@@ -265,7 +329,7 @@ def run(
     base_dir: Optional[Path] = typer.Option(None, "--base-dir", "-d", help="Evals root directory (default: auto-detected)"),
 ) -> None:
     """Run scenarios against skill variants."""
-    from skill_eval.logging import set_level
+    from skill_eval.logging import logger, set_level
     from skill_eval.models import load_scenario
     from skill_eval.runner import Runner, RunTask
 
@@ -340,14 +404,13 @@ def grade(
     base_dir: Optional[Path] = typer.Option(None, "--base-dir", "-d", help="Evals root directory (default: auto-detected)"),
 ) -> None:
     """Grade outputs from a run."""
-    import yaml
-
     from skill_eval.grader import (
         auto_grade_run,
         build_grading_prompt,
         call_claude_grader,
         compute_skill_usage,
         init_grades_file,
+        load_metadata,
         parse_grade_response,
         save_grades,
     )
@@ -366,7 +429,7 @@ def grade(
         total = sum(
             1
             for scenario_dir in run_dir.iterdir()
-            if scenario_dir.is_dir() and not scenario_dir.name.startswith(".")
+            if not scenario_dir.name.startswith(".") and scenario_dir.is_dir()
             for skill_set_dir in scenario_dir.iterdir()
             if skill_set_dir.is_dir()
         )
@@ -375,7 +438,7 @@ def grade(
         results: dict[str, dict[str, dict]] = {}
 
         for scenario_dir in sorted(run_dir.iterdir()):
-            if not scenario_dir.is_dir() or scenario_dir.name.startswith("."):
+            if scenario_dir.name.startswith(".") or not scenario_dir.is_dir():
                 continue
 
             scenario_name = scenario_dir.name
@@ -392,11 +455,7 @@ def grade(
                 from dataclasses import asdict
 
                 # Load metadata for skill usage computation
-                metadata_file = skill_set_dir / "metadata.yaml"
-                metadata = {}
-                if metadata_file.exists():
-                    with metadata_file.open() as f:
-                        metadata = yaml.safe_load(f) or {}
+                metadata = load_metadata(skill_set_dir)
 
                 grading_prompt = build_grading_prompt(scenarios_dir / scenario_name, skill_set_dir)
                 response = call_claude_grader(grading_prompt)
@@ -469,8 +528,6 @@ def review(
     base_dir: Optional[Path] = typer.Option(None, "--base-dir", "-d", help="Evals root directory (default: auto-detected)"),
 ) -> None:
     """Open HTML transcripts in browser for review."""
-    import webbrowser
-
     evals_dir = _get_evals_dir(base_dir)
     runs_dir = evals_dir / "runs"
 
@@ -485,11 +542,13 @@ def review(
 
     typer.echo(f"Opening {len(transcripts)} transcript(s)...")
 
+    urls = []
     for transcript in sorted(transcripts):
         # Show which transcript we're opening
         rel_path = transcript.relative_to(run_dir)
         typer.echo(f"  {rel_path}")
-        webbrowser.open(f"file://{transcript}")
+        urls.append(f"file://{transcript}")
+    _open_urls(urls)
 
 
 @app.command()
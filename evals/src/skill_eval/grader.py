@@ -1,13 +1,17 @@
 """Grading utilities for skill evaluation."""
 
+import functools
+import os
 import re
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import asdict
 from datetime import datetime
 from pathlib import Path
 
 import yaml
 
+from skill_eval._yaml import YamlDumper, YamlLoader
 from skill_eval.models import Grade
 
 
@@ -36,6 +40,15 @@ def compute_skill_usage(metadata: dict) -> tuple[list[str], list[str], float | N
     return available, invoked, pct
 
 
+def load_metadata(output_dir: Path) -> dict:
+    """Load metadata.yaml from a skill-set output directory ({} if missing)."""
+    metadata_file = output_dir / "metadata.yaml"
+    if not metadata_file.exists():
+        return {}
+    with metadata_file.open() as f:
+        return yaml.load(f, Loader=YamlLoader) or {}
+
+
 GRADING_PROMPT_TEMPLATE = """You are grading an AI assistant's response to a task.
 
 ## Task Given
@@ -81,11 +94,32 @@ notes: brief explanation of your grade (one line)
 """
 
 
-def build_grading_prompt(
-    scenario_dir: Path,
-    output_dir: Path,
-) -> str:
-    """Build the grading prompt for a scenario/skill-set combination."""
+def _mtime_ns(path: Path) -> int | None:
+    """Modification time of `path` in ns, or None if it doesn't exist."""
+    try:
+        return path.stat().st_mtime_ns
+    except FileNotFoundError:
+        return None
+
+
+def _load_scenario_section(scenario_dir: Path) -> tuple[str, str]:
+    """Load (scenario description, original prompt) for a scenario.
+
+    Every skill set of a scenario is graded against the same files, so reads
+    are cached; the files' mtimes are part of the key, so edits are picked up.
+    """
+    return _read_scenario_section(
+        scenario_dir,
+        _mtime_ns(scenario_dir / "scenario.md"),
+        _mtime_ns(scenario_dir / "prompt.txt"),
+    )
+
+
+@functools.lru_cache(maxsize=256)
+def _read_scenario_section(
+    scenario_dir: Path, scenario_mtime_ns: int | None, prompt_mtime_ns: int | None
+) -> tuple[str, str]:
+    """_load_scenario_section, cached on the directory and both files' mtimes."""
     # Load scenario description and criteria
     scenario_file = scenario_dir / "scenario.md"
     scenario_content = scenario_file.read_text() if scenario_file.exists() else "No scenario description provided."
@@ -94,24 +128,49 @@ def build_grading_prompt(
     prompt_file = scenario_dir / "prompt.txt"
     prompt_content = prompt_file.read_text() if prompt_file.exists() else "No prompt provided."
 
+    return scenario_content, prompt_content
+
+
+def _list_changes(changes_dir: Path) -> list[str]:
+    """Paths of all files under `changes_dir`, relative to it and sorted.
+
+    Walks with os.scandir so each entry's type comes from the directory read.
+    Returns [] if `changes_dir` doesn't exist.
+    """
+    files: list[str] = []
+    stack = [""]
+    while stack:
+        rel_dir = stack.pop()
+        try:
+            with os.scandir(os.path.join(changes_dir, rel_dir)) as it:
+                for entry in it:
+                    rel_path = os.path.join(rel_dir, entry.name)
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(rel_path)
+                    elif entry.is_file():
+                        files.append(rel_path)
+        except (FileNotFoundError, NotADirectoryError):
+            continue
+    return sorted(files)
+
+
+def build_grading_prompt(
+    scenario_dir: Path,
+    output_dir: Path,
+) -> str:
+    """Build the grading prompt for a scenario/skill-set combination."""
+    scenario_content, prompt_content = _load_scenario_section(scenario_dir)
+
     # Load the assistant's output
     output_file = output_dir / "output.md"
     output_content = output_file.read_text() if output_file.exists() else "No output recorded."
 
     # Load metadata for tools used
-    metadata_file = output_dir / "metadata.yaml"
-    tools_used = []
-    skills_invoked = []
-    skills_available = []
-    mcp_servers = []
-
-    if metadata_file.exists():
-        with metadata_file.open() as f:
-            metadata = yaml.safe_load(f)
-            tools_used = metadata.get("tools_used", [])
-            skills_invoked = metadata.get("skills_invoked", [])
-            skills_available = metadata.get("skills_available", [])
-            mcp_servers = metadata.get("mcp_servers", [])
+    metadata = load_metadata(output_dir)
+    tools_used = metadata.get("tools_used", [])
+    skills_invoked = metadata.get("skills_invoked", [])
+    skills_available = metadata.get("skills_available", [])
+    mcp_servers = metadata.get("mcp_servers", [])
 
     # Build tools section with clear availability vs usage
     tools_lines = ["Tools called:"]
@@ -136,13 +195,7 @@ def build_grading_prompt(
     tools_str = "\n".join(tools_lines)
 
     # List modified files in changes/
-    changes_dir = output_dir / "changes"
-    modified_files = []
-    if changes_dir.exists():
-        for f in changes_dir.rglob("*"):
-            if f.is_file():
-                rel_path = f.relative_to(changes_dir)
-                modified_files.append(str(rel_path))
+    modified_files = _list_changes(output_dir / "changes")
 
     modified_files_str = "\n".join(f"- {f}" for f in modified_files) if modified_files else "No files modified."
 
@@ -155,10 +208,14 @@ def build_grading_prompt(
     )
 
 
+# A ```yaml / ```yml fenced block in a grader response
+_YAML_FENCE_RE = re.compile(r"```ya?ml?\s*(.*?)\s*```", re.DOTALL)
+
+
 def parse_grade_response(response: str) -> Grade:
     """Parse the YAML grade response from Claude."""
     # Try to extract YAML from the response (handle markdown fences if present)
-    yaml_match = re.search(r"```ya?ml?\s*(.*?)\s*```", response, re.DOTALL)
+    yaml_match = _YAML_FENCE_RE.search(response)
     if yaml_match:
         yaml_content = yaml_match.group(1)
     else:
@@ -166,7 +223,7 @@ def parse_grade_response(response: str) -> Grade:
         yaml_content = response.strip()
 
     try:
-        parsed = yaml.safe_load(yaml_content)
+        parsed = yaml.load(yaml_content, Loader=YamlLoader)
         if not isinstance(parsed, dict):
             return Grade(notes=f"Failed to parse: {response[:100]}")
 
@@ -196,40 +253,53 @@ def call_claude_grader(prompt: str) -> str:
         result = subprocess.run(
             cmd,
             capture_output=True,
-            text=True,
             timeout=120,
         )
-        return result.stdout.strip()
+        # Decode once, after trimming; stray invalid bytes shouldn't sink a grade
+        return result.stdout.strip().decode(errors="replace")
     except subprocess.TimeoutExpired:
         return "error: timeout"
     except Exception as e:
         return f"error: {e}"
 
 
-def auto_grade_run(run_dir: Path, scenarios_dir: Path) -> dict:
-    """Auto-grade all outputs in a run using Claude."""
-    results: dict = {}
+def _grade_output(scenario_dir: Path, output_dir: Path) -> Grade:
+    """Grade one skill-set output with Claude."""
+    grading_prompt = build_grading_prompt(scenario_dir, output_dir)
+    response = call_claude_grader(grading_prompt)
+    return parse_grade_response(response)
 
-    for scenario_output_dir in sorted(run_dir.iterdir()):
-        if not scenario_output_dir.is_dir() or scenario_output_dir.name.startswith("."):
-            continue
 
-        scenario_name = scenario_output_dir.name
-        scenario_dir = scenarios_dir / scenario_name
-        results[scenario_name] = {}
+def auto_grade_run(run_dir: Path, scenarios_dir: Path, max_workers: int = 8) -> dict:
+    """Auto-grade all outputs in a run using Claude.
 
-        for skill_set_dir in sorted(scenario_output_dir.iterdir()):
-            if not skill_set_dir.is_dir():
-                continue
+    Each grader call is a separate `claude` subprocess, so up to `max_workers`
+    outputs are graded concurrently.
+    """
+    results: dict = {}
+    # (results dict for the scenario, skill set name, scenario dir, output dir)
+    tasks: list[tuple[dict, str, Path, Path]] = []
 
-            skill_set_name = skill_set_dir.name
+    # DirEntry.is_dir() reuses the file type from the directory read
+    with os.scandir(run_dir) as it:
+        scenario_entries = sorted(
+            (e for e in it if not e.name.startswith(".") and e.is_dir()), key=lambda e: e.name
+        )
 
-            # Build and send grading prompt
-            grading_prompt = build_grading_prompt(scenario_dir, skill_set_dir)
-            response = call_claude_grader(grading_prompt)
-            grade = parse_grade_response(response)
+    for scenario_entry in scenario_entries:
+        scenario_results = results[scenario_entry.name] = {}
+        scenario_dir = scenarios_dir / scenario_entry.name
+
+        with os.scandir(scenario_entry.path) as it:
+            skill_set_entries = sorted((e for e in it if e.is_dir()), key=lambda e: e.name)
+        tasks.extend(
+            (scenario_results, e.name, scenario_dir, Path(e.path)) for e in skill_set_entries
+        )
 
-            results[scenario_name][skill_set_name] = asdict(grade)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        graded = executor.map(lambda task: _grade_output(task[2], task[3]), tasks)
+        for (scenario_results, skill_set_name, _, _), grade in zip(tasks, graded):
+            scenario_results[skill_set_name] = asdict(grade)
 
     grades = {
         "graded_at": datetime.now().isoformat(),
@@ -267,7 +337,7 @@ def init_grades_file(run_dir: Path) -> Path:
     }
 
     with grades_file.open("w") as f:
-        yaml.dump(grades, f, default_flow_style=False, sort_keys=False)
+        yaml.dump(grades, f, Dumper=YamlDumper, default_flow_style=False, sort_keys=False)
 
     return grades_file
 
@@ -278,7 +348,7 @@ def load_grades(run_dir: Path) -> dict:
     if not grades_file.exists():
         return {}
     with grades_file.open() as f:
-        return yaml.safe_load(f)
+        return yaml.load(f, Loader=YamlLoader)
 
 
 def save_grades(run_dir: Path, grades: dict) -> None:
@@ -286,4 +356,4 @@ def save_grades(run_dir: Path, grades: dict) -> None:
     grades["graded_at"] = datetime.now().isoformat()
     grades_file = run_dir / "grades.yaml"
     with grades_file.open("w") as f:
-        yaml.dump(grades, f, default_flow_style=False, sort_keys=False)
+        yaml.dump(grades, f, Dumper=YamlDumper, default_flow_style=False, sort_keys=False)
@@ -5,8 +5,10 @@ from pathlib import Path
 
 import yaml
 
+from skill_eval._yaml import YamlLoader
 
-@dataclass
+
+@dataclass(slots=True)
 class Grade:
     """Result of grading a scenario run."""
 
@@ -22,7 +24,7 @@ class Grade:
     skill_usage_pct: float | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class SkillSet:
     """A combination of skills and MCP servers to test."""
 
@@ -34,7 +36,7 @@ class SkillSet:
     setup: list[str] = field(default_factory=list)  # Commands to run before Claude
 
 
-@dataclass
+@dataclass(slots=True)
 class Scenario:
     """A test scenario with prompt and skill sets."""
 
@@ -57,7 +59,7 @@ def load_scenario(scenario_dir: Path) -> Scenario:
 
     skill_sets_file = scenario_dir / "skill-sets.yaml"
     with skill_sets_file.open() as f:
-        data = yaml.safe_load(f)
+        data = yaml.load(f, Loader=YamlLoader)
 
     skill_sets = [
         SkillSet(
@@ -1,7 +1,8 @@
 """Report generation for skill evaluation."""
 
-from collections import Counter, defaultdict
+from collections import Counter
 from pathlib import Path
+from typing import TypedDict
 
 from rich.console import Console
 from rich.table import Table
@@ -9,36 +10,43 @@ from rich.table import Table
 from skill_eval.grader import load_grades
 
 
-def _compute_skill_set_stats(results: dict) -> dict[str, dict]:
+class _SkillSetStats(TypedDict):
+    """Aggregate grades for one skill set across scenarios."""
+
+    passed: int
+    total: int
+    scores: list[float]
+    tool_usage: Counter[str]
+    skill_usage: list[tuple[int, int]]  # (skills invoked, skills available)
+
+
+def _compute_skill_set_stats(results: dict) -> dict[str, _SkillSetStats]:
     """Compute aggregate statistics per skill set."""
-    # Flatten nested structure into (skill_set_name, data) pairs
-    all_entries = (
-        (skill_set_name, data)
-        for skill_sets in results.values()
-        for skill_set_name, data in skill_sets.items()
-    )
-
-    # Use defaultdict to auto-initialize
-    stats: dict[str, dict] = defaultdict(lambda: {
-        "passed": 0,
-        "total": 0,
-        "scores": [],
-        "tool_usage": Counter(),
-        "skill_usage": [],
-    })
-
-    for skill_set_name, data in all_entries:
-        s = stats[skill_set_name]
-        s["total"] += 1
-        s["passed"] += bool(data.get("success"))
-        if (score := data.get("score")) is not None:
-            s["scores"].append(score)
-        if tool_usage := (data.get("tool_usage") or "").lower():
-            s["tool_usage"][tool_usage] += 1
-        if skills_available := data.get("skills_available", []):
-            s["skill_usage"].append((len(data.get("skills_invoked", [])), len(skills_available)))
-
-    return dict(stats)
+    stats: dict[str, _SkillSetStats] = {}
+
+    for skill_sets in results.values():
+        for skill_set_name, data in skill_sets.items():
+            s = stats.get(skill_set_name)
+            if s is None:
+                s = stats[skill_set_name] = _SkillSetStats(
+                    passed=0,
+                    total=0,
+                    scores=[],
+                    tool_usage=Counter(),
+                    skill_usage=[],
+                )
+            get = data.get
+            s["total"] += 1
+            if get("success"):
+                s["passed"] += 1
+            if (score := get("score")) is not None:
+                s["scores"].append(score)
+            if tool_usage := get("tool_usage"):
+                s["tool_usage"][tool_usage.lower()] += 1
+            if skills_available := get("skills_available"):
+                s["skill_usage"].append((len(get("skills_invoked", [])), len(skills_available)))
+
+    return stats
 
 
 def print_rich_report(run_dir: Path, console: Console | None = None) -> None:
@@ -1,17 +1,18 @@
 """Runner for executing scenarios against skill variants."""
 
-import filecmp
 import json
 import os
+import re
 import select
 import shutil
+import stat
 import subprocess
 import tempfile
 import time
 import urllib.request
 
 from skill_eval.logging import logger
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import Executor, ThreadPoolExecutor, as_completed
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
@@ -22,8 +23,38 @@ from urllib.parse import urlparse
 import yaml
 from claude_code_transcripts import generate_html
 
+from skill_eval._yaml import YamlDumper
 from skill_eval.models import Scenario, SkillSet
 
+# Usage fields summed into a run's total input tokens
+_INPUT_TOKEN_KEYS = ("input_tokens", "cache_read_input_tokens", "cache_creation_input_tokens")
+
+# Skill paths starting with these (case-insensitively) are downloaded
+_URL_PREFIXES = ("http://", "https://")
+
+# GitHub blob URL format: https://github.com/org/repo/blob/branch/path/to/file
+# (query string and fragment are dropped)
+_GITHUB_PREFIXES = ("https://github.com/", "http://github.com/")
+_GITHUB_BLOB_RE = re.compile(r"https?://github\.com/([^/?#]+/[^/?#]+)/blob/([^?#]+)")
+
+# Title claude-code-transcripts gives its pages, and where it appears: the
+# <title> tag and <h1> text - both index.html (direct h1) and page-xxx.html
+# (h1 with anchor wrapper). Matched on bytes so pages aren't decoded.
+_DEFAULT_TRANSCRIPT_TITLE = b"Claude Code transcript"
+_TRANSCRIPT_TITLE_RE = re.compile(rb"<title>Claude Code transcript|>Claude Code transcript<")
+
+# How Claude writes "user" stream-json lines (tool results, often the bulk of
+# the output). Nothing is read from them, so lines with this prefix are
+# skipped without decoding; any other spelling is decoded and then ignored.
+_USER_MESSAGE_PREFIX = '{"type":"user"'
+
+# Tool name Claude uses when invoking a skill
+_SKILL_TOOL = "Skill"
+
+# Bound once: json.loads re-checks its arguments and looks up the default
+# decoder on every call, which adds up over thousands of stream-json lines
+_json_decode = json.JSONDecoder().decode
+
 
 @dataclass
 class RunResult:
@@ -47,6 +78,189 @@ class RunTask:
     run_dir: Path
 
 
+@dataclass
+class _ParsedOutput:
+    """Accumulates data from Claude stream-json messages."""
+
+    # Insertion-ordered set: repeated invocations of a skill are recorded once
+    skills_invoked: dict[str, None] = field(default_factory=dict)
+    tools_used: set[str] = field(default_factory=set)
+    text_parts: list[str] = field(default_factory=list)
+    # From init message
+    model: str | None = None
+    skills_available: list[str] = field(default_factory=list)
+    mcp_servers: list[str] = field(default_factory=list)
+    # From result message
+    duration_ms: int | None = None
+    num_turns: int | None = None
+    total_cost_usd: float | None = None
+    input_tokens: int | None = None
+    output_tokens: int | None = None
+
+    def as_dict(self) -> dict:
+        """The result dict returned by `Runner._parse_json_output`."""
+        return {
+            "output_text": "\n\n".join(self.text_parts),
+            "skills_invoked": list(self.skills_invoked),
+            "tools_used": list(self.tools_used),
+            "model": self.model,
+            "skills_available": self.skills_available,
+            "mcp_servers": self.mcp_servers,
+            "duration_ms": self.duration_ms,
+            "num_turns": self.num_turns,
+            "total_cost_usd": self.total_cost_usd,
+            "input_tokens": self.input_tokens,
+            "output_tokens": self.output_tokens,
+        }
+
+    def feed(self, line: str) -> dict | None:
+        """Parse one NDJSON line and record it; returns the message, if any."""
+        # json decoding accepts surrounding whitespace, so lines aren't stripped first
+        if not line or line.isspace() or line.startswith(_USER_MESSAGE_PREFIX):
+            return None
+        try:
+            msg = _json_decode(line)
+        except json.JSONDecodeError:
+            return None
+
+        if not isinstance(msg, dict):
+            return None
+
+        handler = _MESSAGE_HANDLERS.get(msg.get("type"))
+        if handler is not None:
+            handler(msg, self)
+        return msg
+
+
+def _handle_system(msg: dict, parsed: _ParsedOutput) -> None:
+    """Record model, skills and MCP servers from the init message."""
+    if msg.get("subtype") != "init":
+        return
+    parsed.model = msg.get("model")
+    parsed.skills_available = msg.get("skills", [])
+    mcp_servers = msg.get("mcp_servers", [])
+    parsed.mcp_servers = list(mcp_servers.keys()) if isinstance(mcp_servers, dict) else mcp_servers
+
+
+def _handle_assistant(msg: dict, parsed: _ParsedOutput) -> None:
+    """Record text and tool usage from an assistant message."""
+    for content in msg.get("message", {}).get("content", []):
+        if not isinstance(content, dict):
+            continue
+        content_type = content.get("type")
+        if content_type == "text":
+            text = content.get("text", "").strip()
+            if text:
+                parsed.text_parts.append(text)
+        elif content_type == "tool_use":
+            tool_name = content.get("name", "")
+            if not tool_name:
+                continue
+            parsed.tools_used.add(tool_name)
+            # Check if it's a Skill invocation
+            if tool_name == _SKILL_TOOL:
+                skill_name = content.get("input", {}).get("skill", "")
+                if skill_name:
+                    parsed.skills_invoked[skill_name] = None
+
+
+def _handle_result(msg: dict, parsed: _ParsedOutput) -> None:
+    """Record duration, cost and token usage from the result message."""
+    parsed.duration_ms = msg.get("duration_ms")
+    parsed.num_turns = msg.get("num_turns")
+    parsed.total_cost_usd = msg.get("total_cost_usd")
+    usage = msg.get("usage", {})
+    parsed.input_tokens = sum(usage.get(k, 0) for k in _INPUT_TOKEN_KEYS)
+    parsed.output_tokens = usage.get("output_tokens")
+
+
+# Stream-json message type -> handler; other types (e.g. "user") are ignored
+_MESSAGE_HANDLERS: dict[str, Callable[[dict, _ParsedOutput], None]] = {
+    "system": _handle_system,
+    "assistant": _handle_assistant,
+    "result": _handle_result,
+}
+
+
+def _write_bytes(path: Path, data: bytes, mode: int = 0o644) -> None:
+    """Write `data` to `path` with raw os calls (no text layer or buffering)."""
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, mode)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+
+def _copy_file(src: str | Path, dst: str | Path) -> None:
+    """Copy file contents with os.copy_file_range where available.
+
+    The data never passes through user space, and filesystems that support
+    it (btrfs, XFS) share extents instead of copying. Falls back to
+    shutil.copyfile when the kernel or filesystem can't do it.
+    """
+    if hasattr(os, "copy_file_range"):
+        try:
+            with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+                size = os.fstat(fsrc.fileno()).st_size
+                copied = 0
+                while copied < size:
+                    n = os.copy_file_range(fsrc.fileno(), fdst.fileno(), size - copied)
+                    if not n:
+                        break  # some filesystems (FUSE, procfs) report 0 without copying
+                    copied += n
+            # A size of 0 may just be a file that doesn't report one (procfs),
+            # so leave those to copyfile, which reads until EOF
+            if size and copied == size:
+                return
+        except OSError:
+            pass  # e.g. EXDEV or ENOSYS on older kernels
+    shutil.copyfile(src, dst)  # truncates whatever a failed attempt left in dst
+
+
+def _copy_file_and_stat(src: str, dst: str) -> None:
+    """copytree copy_function: _copy_file plus shutil.copy2's metadata copy."""
+    _copy_file(src, dst)
+    shutil.copystat(src, dst)
+
+
+# Read size for comparing file contents; larger than filecmp's 8 KiB buffer
+_COMPARE_CHUNK = 64 * 1024
+
+# Above this many files to compare, _find_changed_files compares in a thread pool
+_PARALLEL_COMPARE_THRESHOLD = 64
+
+
+def _same_contents(path_a: str, path_b: str) -> bool:
+    """Compare two equal-sized files chunk by chunk, stopping at the first difference."""
+    with open(path_a, "rb", buffering=0) as fa, open(path_b, "rb", buffering=0) as fb:
+        while True:
+            chunk_a = fa.read(_COMPARE_CHUNK)
+            if chunk_a != fb.read(_COMPARE_CHUNK):
+                return False
+            if not chunk_a:
+                return True
+
+
+def _file_changed(original_path: str, entry: os.DirEntry) -> bool:
+    """Whether `entry` differs from (or has no counterpart at) `original_path`."""
+    try:
+        original_stat = os.stat(original_path)
+    except OSError:
+        return True  # New file
+    if not stat.S_ISREG(original_stat.st_mode):
+        return True
+    modified_stat = entry.stat()
+    # Different sizes can't match; skip reading either file
+    if original_stat.st_size != modified_stat.st_size:
+        return True
+    # Same size and mtime: copied from context and untouched (copytree keeps mtimes)
+    if original_stat.st_mtime_ns == modified_stat.st_mtime_ns:
+        return False
+    return not _same_contents(original_path, entry.path)
+
+
 def _find_changed_files(
     original_dir: Path,
     modified_dir: Path,
@@ -54,43 +268,47 @@ def _find_changed_files(
 ) -> list[Path]:
     """Find files that changed or were added in modified_dir compared to original_dir.
 
-    Uses filecmp for efficient stat-based comparison.
+    Walks modified_dir with os.scandir so each entry's type comes from the
+    directory read; files present in both trees are compared by size and
+    mtime first, then contents.
     Returns list of relative paths to changed/new files.
     """
+    # If original_dir doesn't exist, everything is new
+    has_original = bool(original_dir) and original_dir.exists()
     changed: list[Path] = []
+    # (relative path, file entry) pairs to compare against original_dir
+    candidates: list[tuple[str, os.DirEntry]] = []
+
+    stack = [""]
+    while stack:
+        rel_dir = stack.pop()
+        with os.scandir(os.path.join(modified_dir, rel_dir)) as it:
+            for entry in it:
+                if entry.name in exclude_names:
+                    continue
+                rel_path = os.path.join(rel_dir, entry.name)
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(rel_path)
+                elif not entry.is_file():
+                    continue
+                elif has_original:
+                    candidates.append((rel_path, entry))
+                else:
+                    changed.append(Path(rel_path))
 
-    def _compare_dirs(dcmp: filecmp.dircmp, rel_path: Path = Path(".")) -> None:
-        # Files that differ
-        for name in dcmp.diff_files:
-            if name not in exclude_names:
-                changed.append(rel_path / name)
-
-        # Files only in modified_dir (new files)
-        for name in dcmp.right_only:
-            if name not in exclude_names:
-                item = modified_dir / rel_path / name
-                if item.is_file():
-                    changed.append(rel_path / name)
-                elif item.is_dir():
-                    # New directory - add all files within
-                    for f in item.rglob("*"):
-                        if f.is_file() and f.name not in exclude_names:
-                            changed.append(f.relative_to(modified_dir))
-
-        # Recurse into subdirectories
-        for name, sub_dcmp in dcmp.subdirs.items():
-            if name not in exclude_names:
-                _compare_dirs(sub_dcmp, rel_path / name)
-
-    # Handle case where original_dir doesn't exist (everything is new)
-    if not original_dir or not original_dir.exists():
-        for f in modified_dir.rglob("*"):
-            if f.is_file() and f.name not in exclude_names:
-                changed.append(f.relative_to(modified_dir))
-        return changed
-
-    dcmp = filecmp.dircmp(original_dir, modified_dir, ignore=list(exclude_names))
-    _compare_dirs(dcmp)
+    def _check(candidate: tuple[str, os.DirEntry]) -> bool:
+        rel_path, entry = candidate
+        return _file_changed(os.path.join(original_dir, rel_path), entry)
+
+    # Comparisons are independent and mostly I/O; threads only pay off for
+    # larger trees
+    if len(candidates) > _PARALLEL_COMPARE_THRESHOLD:
+        with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 4)) as executor:
+            results = list(executor.map(_check, candidates))
+    else:
+        results = [_check(c) for c in candidates]
+
+    changed.extend(Path(rel_path) for (rel_path, _), is_changed in zip(candidates, results) if is_changed)
     return changed
 
 
@@ -118,11 +336,8 @@ class Runner:
 
     def _is_url(self, path: str) -> bool:
         """Check if a skill path is an HTTP(S) URL."""
-        try:
-            parsed = urlparse(path)
-            return parsed.scheme in ("http", "https")
-        except Exception:
-            return False
+        # Schemes are case-insensitive; "https://" is the longest prefix
+        return path[:8].lower().startswith(_URL_PREFIXES)
 
     def _normalize_github_url(self, url: str) -> str:
         """Convert GitHub blob URLs to raw URLs.
@@ -130,16 +345,14 @@ class Runner:
         Converts: https://github.com/org/repo/blob/main/path/SKILL.md
         To:       https://raw.githubusercontent.com/org/repo/main/path/SKILL.md
         """
-        parsed = urlparse(url)
-        if parsed.netloc != "github.com":
+        # Most skill URLs aren't github.com pages; skip the regex for those
+        if not url.startswith(_GITHUB_PREFIXES):
             return url
 
-        # GitHub blob URL format: /org/repo/blob/branch/path/to/file
-        path_parts = parsed.path.split("/")
-        if len(path_parts) >= 5 and path_parts[3] == "blob":
-            # Remove "blob" from path: /org/repo/branch/path/to/file
-            new_path = "/".join(path_parts[:3] + path_parts[4:])
-            return f"https://raw.githubusercontent.com{new_path}"
+        # Remove "blob" from path: /org/repo/branch/path/to/file
+        match = _GITHUB_BLOB_RE.match(url)
+        if match:
+            return f"https://raw.githubusercontent.com/{match[1]}/{match[2]}"
 
         return url
 
@@ -159,6 +372,18 @@ class Runner:
         # Convert GitHub blob URLs to raw URLs
         download_url = self._normalize_github_url(url)
 
+        dest = skills_dir / self._download_folder_name(download_url) / "SKILL.md"
+        dest.parent.mkdir(exist_ok=True)
+
+        try:
+            with urllib.request.urlopen(download_url, timeout=30) as response:
+                # Saved as served; no decode/re-encode round trip
+                _write_bytes(dest, response.read())
+        except URLError as e:
+            raise RuntimeError(f"Failed to download skill from {download_url}: {e}") from e
+
+    def _download_folder_name(self, download_url: str) -> str:
+        """Folder under the skills directory that a downloaded SKILL.md goes in."""
         parsed = urlparse(download_url)
         path = parsed.path.rstrip("/")
 
@@ -180,15 +405,19 @@ class Runner:
             # Root-level skill on non-GitHub host
             folder_name = parsed.netloc.replace(".", "-")
 
-        dest = skills_dir / folder_name / "SKILL.md"
-        dest.parent.mkdir(parents=True, exist_ok=True)
+        return folder_name
 
-        try:
-            with urllib.request.urlopen(download_url, timeout=30) as response:
-                content = response.read().decode("utf-8")
-                dest.write_text(content)
-        except URLError as e:
-            raise RuntimeError(f"Failed to download skill from {download_url}: {e}") from e
+    def _skill_folder_name(self, skill: str) -> str | None:
+        """Folder under the skills directory that a skill (URL or local path) goes in.
+
+        None for a local path that doesn't exist, which is skipped when copying.
+        """
+        if self._is_url(skill):
+            return self._download_folder_name(self._normalize_github_url(skill))
+        src = self.repo_dir / skill
+        if not src.exists():
+            return None
+        return src.name if src.is_dir() else src.parent.name
 
     def _copy_local_skill(self, skill_path: str, skills_dir: Path) -> None:
         """Copy a local skill (file or folder) to the skills directory."""
@@ -198,12 +427,13 @@ class Runner:
 
         if src.is_dir():
             # Folder path: copy entire folder
-            shutil.copytree(src, skills_dir / src.name)
+            shutil.copytree(src, skills_dir / src.name, copy_function=_copy_file_and_stat)
         else:
             # File path: copy just the file, skill name is parent folder name
+            # (contents only, no chmod)
             dest = skills_dir / src.parent.name / "SKILL.md"
-            dest.parent.mkdir(parents=True, exist_ok=True)
-            shutil.copy(src, dest)
+            dest.parent.mkdir(exist_ok=True)
+            _copy_file(src, dest)
 
     def _generate_transcript(
         self, env_dir: Path, output_dir: Path, scenario_name: str, skill_set_name: str, log=None
@@ -217,10 +447,19 @@ class Runner:
         if not claude_projects.exists():
             return
 
-        session_file = next(
-            (f for f in claude_projects.glob("*/*.jsonl") if not f.name.startswith("agent-")),
-            None,
-        )
+        # Stop at the first main session file instead of globbing every project
+        session_file = None
+        with os.scandir(claude_projects) as projects:
+            for project in projects:
+                if not project.is_dir():
+                    continue
+                with os.scandir(project.path) as entries:
+                    for entry in entries:
+                        if entry.name.endswith(".jsonl") and not entry.name.startswith("agent-"):
+                            session_file = Path(entry.path)
+                            break
+                if session_file:
+                    break
         if not session_file:
             return
 
@@ -242,21 +481,14 @@ class Runner:
                     log.debug(f"transcript: {line}")
 
             # Update HTML titles to include scenario and skill set info
-            custom_title = f"{scenario_name} / {skill_set_name}"
+            custom_title = f"{scenario_name} / {skill_set_name}".encode()
+
+            def _retitle(match: re.Match[bytes]) -> bytes:
+                return match[0].replace(_DEFAULT_TRANSCRIPT_TITLE, custom_title)
+
             for html_file in transcript_dir.glob("*.html"):
-                content = html_file.read_text()
-                # Replace in <title> tags
-                content = content.replace(
-                    "<title>Claude Code transcript",
-                    f"<title>{custom_title}",
-                )
-                # Replace in <h1> tags - handles both index.html (direct h1)
-                # and page-xxx.html (h1 with anchor wrapper)
-                content = content.replace(
-                    ">Claude Code transcript<",
-                    f">{custom_title}<",
-                )
-                html_file.write_text(content)
+                content = _TRANSCRIPT_TITLE_RE.sub(_retitle, html_file.read_bytes())
+                html_file.write_bytes(content)
         except Exception as e:
             log.warning(f"Transcript generation failed: {e}")
 
@@ -276,32 +508,54 @@ class Runner:
     ) -> tuple[Path, Path | None]:
         """Create isolated environment with only specified skills.
 
+        The environment lives in a fresh temp parent so context can be copied
+        with copytree's fast path; remove ``env_dir.parent`` to clean up.
+
         Returns: (env_dir, mcp_config_path)
         """
-        env_dir = Path(tempfile.mkdtemp(prefix="skill-eval-"))
+        env_parent = Path(tempfile.mkdtemp(prefix="skill-eval-"))
+        env_dir = env_parent / "env"
 
         if context_dir and context_dir.exists():
-            shutil.copytree(context_dir, env_dir, dirs_exist_ok=True)
+            shutil.copytree(context_dir, env_dir)
+        else:
+            env_dir.mkdir()
 
         # Create .claude directory
         claude_dir = env_dir / ".claude"
-        claude_dir.mkdir(parents=True, exist_ok=True)
+        # env_dir exists, so no parents; context may already have .claude/
+        claude_dir.mkdir(exist_ok=True)
 
         # Copy credentials from keychain to isolated environment
         credentials = self._get_claude_credentials()
         if credentials:
-            (claude_dir / ".credentials.json").write_text(credentials)
+            _write_bytes(claude_dir / ".credentials.json", credentials.encode(), mode=0o600)
 
         # Load skills from local paths or HTTP URLs
         if skills:
             skills_dir = claude_dir / "skills"
-            skills_dir.mkdir(parents=True, exist_ok=True)
-
-            for skill_path in skills:
-                if self._is_url(skill_path):
-                    self._download_skill(skill_path, skills_dir)
-                else:
-                    self._copy_local_skill(skill_path, skills_dir)
+            skills_dir.mkdir(exist_ok=True)
+
+            urls = [s for s in skills if self._is_url(s)]
+            folders = [f for f in map(self._skill_folder_name, skills) if f is not None]
+
+            if urls and len(set(folders)) == len(folders):
+                # Downloads are network-bound: fetch them concurrently while
+                # local skills are copied (no two skills share a folder)
+                with ThreadPoolExecutor(max_workers=min(16, len(urls))) as executor:
+                    downloads = executor.map(lambda url: self._download_skill(url, skills_dir), urls)
+                    for skill_path in skills:
+                        if not self._is_url(skill_path):
+                            self._copy_local_skill(skill_path, skills_dir)
+                    # Re-raise the first download failure, if any
+                    list(downloads)
+            else:
+                # Skills sharing a folder overwrite each other in list order
+                for skill_path in skills:
+                    if self._is_url(skill_path):
+                        self._download_skill(skill_path, skills_dir)
+                    else:
+                        self._copy_local_skill(skill_path, skills_dir)
 
         # Copy .env from scenario dir if it exists
         env_file = scenario_dir / ".env"
@@ -312,7 +566,7 @@ class Runner:
         mcp_config_path = None
         if mcp_servers:
             mcp_config_path = claude_dir / "mcp-servers.json"
-            mcp_config_path.write_text(json.dumps({"mcpServers": mcp_servers}, indent=2))
+            _write_bytes(mcp_config_path, json.dumps({"mcpServers": mcp_servers}, indent=2).encode())
 
         return env_dir, mcp_config_path
 
@@ -321,77 +575,13 @@ class Runner:
 
         Returns dict with: output_text, skills_invoked, tools_used, and run metadata.
         """
-        result = {
-            "output_text": "",
-            "skills_invoked": [],
-            "tools_used": [],
-            # From init message
-            "model": None,
-            "skills_available": [],
-            "mcp_servers": [],
-            # From result message
-            "duration_ms": None,
-            "num_turns": None,
-            "total_cost_usd": None,
-            "input_tokens": None,
-            "output_tokens": None,
-        }
-
-        text_parts = []
-        skills_invoked = []
-        tools_used = set()
+        parsed = _ParsedOutput()
 
         # Parse each line as separate JSON (NDJSON format)
-        for line in json_str.strip().split("\n"):
-            if not line.strip():
-                continue
-            try:
-                msg = json.loads(line)
-            except json.JSONDecodeError:
-                continue
-
-            if not isinstance(msg, dict):
-                continue
+        for line in json_str.split("\n"):
+            parsed.feed(line)
 
-            # Extract init message data
-            if msg.get("type") == "system" and msg.get("subtype") == "init":
-                result["model"] = msg.get("model")
-                result["skills_available"] = msg.get("skills", [])
-                result["mcp_servers"] = list(msg.get("mcp_servers", {}).keys()) if isinstance(msg.get("mcp_servers"), dict) else msg.get("mcp_servers", [])
-
-            # Extract text and tool usage from assistant messages
-            if msg.get("type") == "assistant":
-                for content in msg.get("message", {}).get("content", []):
-                    if isinstance(content, dict):
-                        if content.get("type") == "text":
-                            text = content.get("text", "").strip()
-                            if text:
-                                text_parts.append(text)
-                        elif content.get("type") == "tool_use":
-                            tool_name = content.get("name", "")
-                            if tool_name:
-                                tools_used.add(tool_name)
-                            # Check if it's a Skill invocation
-                            if tool_name == "Skill":
-                                skill_input = content.get("input", {})
-                                skill_name = skill_input.get("skill", "")
-                                if skill_name:
-                                    skills_invoked.append(skill_name)
-
-            # Extract result message data (duration, cost, tokens)
-            if msg.get("type") == "result":
-                result["duration_ms"] = msg.get("duration_ms")
-                result["num_turns"] = msg.get("num_turns")
-                result["total_cost_usd"] = msg.get("total_cost_usd")
-                usage = msg.get("usage", {})
-                result["input_tokens"] = usage.get("input_tokens", 0) + usage.get("cache_read_input_tokens", 0) + usage.get("cache_creation_input_tokens", 0)
-                result["output_tokens"] = usage.get("output_tokens")
-
-        result["output_text"] = "\n\n".join(text_parts)
-        result["skills_invoked"] = skills_invoked
-        result["tools_used"] = list(tools_used)
-
-        return result
+        return parsed.as_dict()
 
     def _read_output_line(
         self, proc: subprocess.Popen, timeout: float = 1.0
@@ -404,14 +594,9 @@ class Runner:
             return None
         return proc.stdout.readline() or None
 
-    def _log_progress(self, line: str, elapsed: float, log=None) -> None:
-        """Log progress from a JSON line (tool calls, etc.)."""
+    def _log_progress(self, msg: dict, elapsed: float, log=None) -> None:
+        """Log progress from a parsed stream-json message (tool calls, etc.)."""
         log = log or logger
-        try:
-            msg = json.loads(line)
-        except json.JSONDecodeError:
-            return
-
         if msg.get("type") != "assistant":
             return
 
@@ -426,7 +611,7 @@ class Runner:
             elapsed_sec = int(elapsed % 60)
 
             # Show skill name when Skill tool is invoked
-            if tool_name == "Skill":
+            if tool_name == _SKILL_TOOL:
                 skill_name = content.get("input", {}).get("skill", "unknown")
                 log.debug(f"[{elapsed_min}:{elapsed_sec:02d}] skill: {skill_name}")
             else:
@@ -521,6 +706,9 @@ class Runner:
                 env=env,
             )
 
+            # Lines are parsed as they arrive rather than re-split from the
+            # joined output once Claude exits
+            output = _ParsedOutput()
             stdout_lines: list[str] = []
             stderr_lines: list[str] = []
             start_time = time.time()
@@ -553,14 +741,21 @@ class Runner:
 
                 stdout_lines.append(line)
                 last_output_time = time.time()
-                self._log_progress(line, elapsed, log)
+                # Each line is decoded once, for both the result and progress
+                msg = output.feed(line)
+                if msg is not None:
+                    self._log_progress(msg, elapsed, log)
 
             # Read any remaining output
+            streamed = len(stdout_lines)
             self._drain_remaining_output(proc, stdout_lines, stderr_lines)
+            for remaining in stdout_lines[streamed:]:
+                for line in remaining.split("\n"):
+                    output.feed(line)
 
             raw_json = "".join(stdout_lines)
             stderr = "".join(stderr_lines)
-            parsed = self._parse_json_output(raw_json) if raw_json else {}
+            parsed = output.as_dict() if raw_json else {}
 
             if stderr:
                 parsed["output_text"] = parsed.get("output_text", "") + f"\n\n[stderr]\n{stderr}"
@@ -615,9 +810,9 @@ class Runner:
                     (output_dir / "raw.jsonl").write_text("")
                     metadata = {"success": False, "error": error_msg}
                     (output_dir / "metadata.yaml").write_text(
-                        yaml.dump(metadata, default_flow_style=False, sort_keys=False)
+                        yaml.dump(metadata, Dumper=YamlDumper, default_flow_style=False, sort_keys=False)
                     )
-                    shutil.rmtree(env_dir, ignore_errors=True)
+                    shutil.rmtree(env_dir.parent, ignore_errors=True)
                     return RunResult(
                         scenario_name=scenario.name,
                         skill_set_name=skill_set.name,
@@ -662,7 +857,7 @@ class Runner:
         if error:
             metadata["error"] = error
         (output_dir / "metadata.yaml").write_text(
-            yaml.dump(metadata, default_flow_style=False, sort_keys=False)
+            yaml.dump(metadata, Dumper=YamlDumper, default_flow_style=False, sort_keys=False)
         )
 
         # Copy only files that changed (excluding .claude, caches, .env)
@@ -673,14 +868,14 @@ class Runner:
             scenario.context_dir, env_dir, exclude_names
         )
 
+        # Create each destination directory once rather than once per file
+        for rel_dir in {rel_path.parent for rel_path in changed_files}:
+            os.makedirs(changes_output / rel_dir, exist_ok=True)
         for rel_path in changed_files:
-            src = env_dir / rel_path
-            dest = changes_output / rel_path
-            dest.parent.mkdir(parents=True, exist_ok=True)
-            shutil.copy2(src, dest)
+            shutil.copy2(env_dir / rel_path, changes_output / rel_path)
 
         self._generate_transcript(env_dir, output_dir, scenario.name, skill_set.name, ctx_logger)
-        shutil.rmtree(env_dir, ignore_errors=True)
+        shutil.rmtree(env_dir.parent, ignore_errors=True)
 
         return RunResult(
             scenario_name=scenario.name,
@@ -697,6 +892,7 @@ class Runner:
         tasks: list[RunTask],
         max_workers: int = 4,
         progress_callback: Callable[[RunTask, RunResult], None] | None = None,
+        executor_cls: Callable[..., Executor] = ThreadPoolExecutor,
     ) -> list[RunResult]:
         """Run multiple tasks in parallel.
 
@@ -704,13 +900,17 @@ class Runner:
             tasks: List of RunTask objects to execute
             max_workers: Maximum number of concurrent workers
             progress_callback: Optional callback called after each task completes
+            executor_cls: Executor to run tasks in. Threads suit the usual case,
+                where each task mostly waits on its Claude subprocess; pass
+                ProcessPoolExecutor to parse large outputs outside the GIL
+                (the runner and tasks are pickled to the workers)
 
         Returns:
             List of RunResult objects (order may differ from input)
         """
         results: list[RunResult] = []
 
-        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        with executor_cls(max_workers=max_workers) as executor:
             # Submit all tasks
             future_to_task = {
                 executor.submit(self._run_task, task): task for task in tasks
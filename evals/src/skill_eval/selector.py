@@ -3,7 +3,6 @@
 from __future__ import annotations
 
 import shutil
-import sys
 from dataclasses import dataclass
 from pathlib import Path
 
@@ -12,8 +11,10 @@ from textual.app import App, ComposeResult
 from textual.widgets import Footer, Header, Input, OptionList
 from textual.widgets.option_list import Option
 
+from skill_eval._yaml import YamlLoader
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class RunInfo:
     """Information about a run for display in selector.
 
@@ -35,12 +36,12 @@ class RunInfo:
         scenarios_detail: dict[str, list[str]] = {}
 
         for scenario_dir in path.iterdir():
-            if not scenario_dir.is_dir() or scenario_dir.name.startswith("."):
+            if scenario_dir.name.startswith(".") or not scenario_dir.is_dir():
                 continue
             skill_sets = [
                 d.name
                 for d in scenario_dir.iterdir()
-                if d.is_dir() and not d.name.startswith(".")
+                if not d.name.startswith(".") and d.is_dir()
             ]
             if skill_sets:
                 scenarios_detail[scenario_dir.name] = sorted(skill_sets)
@@ -87,7 +88,7 @@ class RunInfo:
         return full_text
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ScenarioInfo:
     """Information about a scenario for display in selector.
 
@@ -110,7 +111,7 @@ class ScenarioInfo:
         if skill_sets_file.exists():
             try:
                 with skill_sets_file.open() as f:
-                    data = yaml.safe_load(f)
+                    data = yaml.load(f, Loader=YamlLoader)
                     skill_set_count = len(data.get("sets", []))
             except yaml.YAMLError:
                 pass
@@ -145,11 +146,6 @@ class ScenarioInfo:
         return " | ".join(parts)
 
 
-def is_interactive() -> bool:
-    """Check if running in interactive mode (TTY)."""
-    return sys.stdin.isatty()
-
-
 class RunSelectorApp(App[Path | None]):
     """Single-selection app for choosing a run."""
 
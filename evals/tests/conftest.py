@@ -0,0 +1,68 @@
+"""Shared pytest fixtures for skill_eval tests."""
+
+from collections.abc import Callable
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+
+@pytest.fixture
+def runs_dir(tmp_path: Path) -> Path:
+    """A runs/ directory at tmp_path with two empty runs, 2024-01-01 and 2024-01-02."""
+    runs_dir = tmp_path / "runs"
+    for name in ["2024-01-01-100000", "2024-01-02-100000"]:
+        (runs_dir / name).mkdir(parents=True)
+    return runs_dir
+
+
+def _make_tree(root: Path, files: dict[str, str | bytes]) -> None:
+    for rel, content in files.items():
+        path = root / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        if isinstance(content, bytes):
+            path.write_bytes(content)
+        else:
+            path.write_text(content)
+
+
+@pytest.fixture
+def make_tree() -> Callable[[Path, dict[str, str | bytes]], None]:
+    """Factory that creates `files` (relative path -> content) under a root directory."""
+    return _make_tree
+
+
+@pytest.fixture
+def eval_tree(tmp_path: Path) -> Path:
+    """An evals/ directory at tmp_path with one empty scenario, scenarios/test."""
+    evals_dir = tmp_path / "evals"
+    (evals_dir / "scenarios" / "test").mkdir(parents=True)
+    return evals_dir
+
+
+class FakeURLResponse:
+    """Minimal stand-in for the context manager urlopen returns."""
+
+    def __init__(self, data: bytes) -> None:
+        self._data = data
+
+    def read(self) -> bytes:
+        return self._data
+
+    def __enter__(self) -> "FakeURLResponse":
+        return self
+
+    def __exit__(self, *exc_info: object) -> bool:
+        return False
+
+
+@pytest.fixture
+def urlopen_mock(monkeypatch: pytest.MonkeyPatch) -> Callable[[bytes], MagicMock]:
+    """Factory that patches the runner's urlopen to serve `content`; returns the urlopen mock."""
+
+    def _urlopen_mock(content: bytes) -> MagicMock:
+        urlopen = MagicMock(return_value=FakeURLResponse(content))
+        monkeypatch.setattr("skill_eval.runner.urllib.request.urlopen", urlopen)
+        return urlopen
+
+    return _urlopen_mock
@@ -1,20 +1,29 @@
 """Tests for skill_eval CLI."""
 
+import os
+import subprocess
+import sys
+from collections.abc import Generator
+from contextlib import ExitStack, contextmanager
 from pathlib import Path
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 import pytest
 from click.exceptions import Exit
 
-from skill_eval.cli import find_evals_root, find_run, find_scenarios, get_latest_run
+from skill_eval.cli import find_evals_root, find_run, find_scenarios, get_latest_run, is_interactive
 
 
-def test_get_latest_run_returns_most_recent(tmp_path: Path) -> None:
+@contextmanager
+def _interactive(selector: str, return_value: object) -> Generator[MagicMock]:
+    """Patch the CLI as interactive, with `selector` returning `return_value`."""
+    with ExitStack() as stack:
+        stack.enter_context(patch("skill_eval.cli.is_interactive", return_value=True))
+        yield stack.enter_context(patch(f"skill_eval.selector.{selector}", return_value=return_value))
+
+
+def test_get_latest_run_returns_most_recent(runs_dir: Path) -> None:
     """get_latest_run returns the most recently named run directory."""
-    runs_dir = tmp_path / "runs"
-    runs_dir.mkdir()
-    (runs_dir / "2024-01-01-100000").mkdir()
-    (runs_dir / "2024-01-02-100000").mkdir()
     (runs_dir / "2024-01-01-150000").mkdir()
 
     result = get_latest_run(runs_dir)
@@ -34,6 +43,15 @@ def test_get_latest_run_ignores_hidden_dirs(tmp_path: Path) -> None:
     assert result.name == "2024-01-01-100000"
 
 
+def test_get_latest_run_sees_new_runs(runs_dir: Path) -> None:
+    """get_latest_run picks up a run created after an earlier call."""
+    assert get_latest_run(runs_dir).name == "2024-01-02-100000"
+
+    (runs_dir / "2024-01-03-100000").mkdir()
+
+    assert get_latest_run(runs_dir).name == "2024-01-03-100000"
+
+
 def test_get_latest_run_exits_when_no_runs(tmp_path: Path) -> None:
     """get_latest_run exits with error when no runs exist."""
     runs_dir = tmp_path / "runs"
@@ -51,43 +69,36 @@ def test_get_latest_run_exits_when_dir_missing(tmp_path: Path) -> None:
         get_latest_run(runs_dir)
 
 
-def test_find_run_returns_latest_when_none_non_interactive(tmp_path: Path) -> None:
+def test_find_run_returns_latest_when_none_non_interactive(runs_dir: Path) -> None:
     """find_run returns latest run when run_id is None in non-interactive mode."""
-    runs_dir = tmp_path / "runs"
-    runs_dir.mkdir()
-    (runs_dir / "2024-01-01-100000").mkdir()
-    (runs_dir / "2024-01-02-100000").mkdir()
-
     with patch("skill_eval.cli.is_interactive", return_value=False):
         result = find_run(runs_dir, None)
 
     assert result.name == "2024-01-02-100000"
 
 
-def test_find_run_returns_latest_with_flag(tmp_path: Path) -> None:
+def test_find_run_returns_latest_with_flag(runs_dir: Path) -> None:
     """find_run returns latest run when --latest flag is used."""
-    runs_dir = tmp_path / "runs"
-    runs_dir.mkdir()
-    (runs_dir / "2024-01-01-100000").mkdir()
-    (runs_dir / "2024-01-02-100000").mkdir()
-
     result = find_run(runs_dir, None, latest=True)
 
     assert result.name == "2024-01-02-100000"
 
 
-def test_find_run_interactive_calls_selector(tmp_path: Path) -> None:
+def test_find_run_lists_runs_dir_once(runs_dir: Path) -> None:
+    """find_run falling back to latest reads the runs directory only once."""
+    with patch("skill_eval.cli.os.scandir", wraps=os.scandir) as mock_scandir:
+        result = find_run(runs_dir, None, latest=True)
+
+    assert result.name == "2024-01-02-100000"
+    mock_scandir.assert_called_once()
+
+
+def test_find_run_interactive_calls_selector(runs_dir: Path) -> None:
     """find_run shows selector when interactive and no run_id."""
-    runs_dir = tmp_path / "runs"
-    runs_dir.mkdir()
     run1 = runs_dir / "2024-01-01-100000"
-    run2 = runs_dir / "2024-01-02-100000"
-    run1.mkdir()
-    run2.mkdir()
 
-    with patch("skill_eval.cli.is_interactive", return_value=True):
-        with patch("skill_eval.cli.select_run", return_value=run1) as mock_select:
-            result = find_run(runs_dir, None)
+    with _interactive("select_run", run1) as mock_select:
+        result = find_run(runs_dir, None)
 
     mock_select.assert_called_once()
     assert result == run1
@@ -99,10 +110,9 @@ def test_find_run_interactive_cancelled(tmp_path: Path) -> None:
     runs_dir.mkdir()
     (runs_dir / "2024-01-01-100000").mkdir()
 
-    with patch("skill_eval.cli.is_interactive", return_value=True):
-        with patch("skill_eval.cli.select_run", return_value=None):
-            with pytest.raises(Exit):
-                find_run(runs_dir, None)
+    with _interactive("select_run", None):
+        with pytest.raises(Exit):
+            find_run(runs_dir, None)
 
 
 def test_find_run_ambiguous_interactive_shows_selector(tmp_path: Path) -> None:
@@ -114,9 +124,8 @@ def test_find_run_ambiguous_interactive_shows_selector(tmp_path: Path) -> None:
     run1.mkdir()
     run2.mkdir()
 
-    with patch("skill_eval.cli.is_interactive", return_value=True):
-        with patch("skill_eval.cli.select_run", return_value=run1) as mock_select:
-            result = find_run(runs_dir, "01-01")
+    with _interactive("select_run", run1) as mock_select:
+        result = find_run(runs_dir, "01-01")
 
     # Should be called with only the matching runs
     mock_select.assert_called_once()
@@ -125,18 +134,22 @@ def test_find_run_ambiguous_interactive_shows_selector(tmp_path: Path) -> None:
     assert result == run1
 
 
-def test_find_run_exact_match(tmp_path: Path) -> None:
+def test_find_run_exact_match(runs_dir: Path) -> None:
     """find_run returns exact match when provided."""
-    runs_dir = tmp_path / "runs"
-    runs_dir.mkdir()
-    (runs_dir / "2024-01-01-100000").mkdir()
-    (runs_dir / "2024-01-02-100000").mkdir()
-
     result = find_run(runs_dir, "2024-01-01-100000")
 
     assert result.name == "2024-01-01-100000"
 
 
+def test_find_run_exact_match_skips_listing(runs_dir: Path) -> None:
+    """find_run resolves a full run ID without listing the runs directory."""
+    with patch("skill_eval.cli.os.scandir", wraps=os.scandir) as mock_scandir:
+        result = find_run(runs_dir, "2024-01-01-100000")
+
+    assert result == runs_dir / "2024-01-01-100000"
+    mock_scandir.assert_not_called()
+
+
 def test_find_run_partial_match(tmp_path: Path) -> None:
     """find_run returns partial match when unique."""
     runs_dir = tmp_path / "runs"
@@ -236,6 +249,20 @@ def test_find_scenarios_multiple_names(tmp_path: Path) -> None:
     assert "scenario-c" in names
 
 
+def test_find_scenarios_exact_names_skip_listing(tmp_path: Path) -> None:
+    """find_scenarios doesn't list the directory when every name is exact."""
+    scenarios_dir = tmp_path / "scenarios"
+    scenarios_dir.mkdir()
+    (scenarios_dir / "scenario-a").mkdir()
+    (scenarios_dir / "scenario-b").mkdir()
+
+    with patch("skill_eval.cli.os.scandir", wraps=os.scandir) as mock_scandir:
+        result = find_scenarios(scenarios_dir, ["scenario-b", "scenario-a"])
+
+    assert [r.name for r in result] == ["scenario-b", "scenario-a"]
+    mock_scandir.assert_not_called()
+
+
 def test_find_scenarios_ambiguous_match_exits(tmp_path: Path) -> None:
     """find_scenarios exits when partial name matches multiple scenarios."""
     scenarios_dir = tmp_path / "scenarios"
@@ -266,9 +293,8 @@ def test_find_scenarios_interactive_calls_selector(tmp_path: Path) -> None:
     s1.mkdir()
     s2.mkdir()
 
-    with patch("skill_eval.cli.is_interactive", return_value=True):
-        with patch("skill_eval.cli.select_scenarios", return_value=[s1]) as mock_select:
-            result = find_scenarios(scenarios_dir, None)
+    with _interactive("select_scenarios", [s1]) as mock_select:
+        result = find_scenarios(scenarios_dir, None)
 
     mock_select.assert_called_once()
     assert result == [s1]
@@ -283,9 +309,8 @@ def test_find_scenarios_interactive_includes_prefixed(tmp_path: Path) -> None:
     s1.mkdir()
     s2.mkdir()
 
-    with patch("skill_eval.cli.is_interactive", return_value=True):
-        with patch("skill_eval.cli.select_scenarios", return_value=[s2]) as mock_select:
-            result = find_scenarios(scenarios_dir, None)
+    with _interactive("select_scenarios", [s2]) as mock_select:
+        result = find_scenarios(scenarios_dir, None)
 
     # Verify _prefixed was passed to selector
     call_args = mock_select.call_args[0][0]
@@ -300,10 +325,9 @@ def test_find_scenarios_interactive_cancelled(tmp_path: Path) -> None:
     scenarios_dir.mkdir()
     (scenarios_dir / "scenario-a").mkdir()
 
-    with patch("skill_eval.cli.is_interactive", return_value=True):
-        with patch("skill_eval.cli.select_scenarios", return_value=[]):
-            with pytest.raises(Exit):
-                find_scenarios(scenarios_dir, None)
+    with _interactive("select_scenarios", []):
+        with pytest.raises(Exit):
+            find_scenarios(scenarios_dir, None)
 
 
 def test_find_scenarios_non_interactive_no_names_exits(tmp_path: Path) -> None:
@@ -317,6 +341,28 @@ def test_find_scenarios_non_interactive_no_names_exits(tmp_path: Path) -> None:
             find_scenarios(scenarios_dir, None)
 
 
+def test_is_interactive_true_when_tty() -> None:
+    """is_interactive returns True when stdin is a TTY."""
+    with patch("skill_eval.cli.sys.stdin") as mock_stdin:
+        mock_stdin.isatty.return_value = True
+        assert is_interactive() is True
+
+
+def test_is_interactive_false_when_not_tty() -> None:
+    """is_interactive returns False when stdin is not a TTY."""
+    with patch("skill_eval.cli.sys.stdin") as mock_stdin:
+        mock_stdin.isatty.return_value = False
+        assert is_interactive() is False
+
+
+def test_cli_import_defers_textual() -> None:
+    """Importing the CLI doesn't load Textual until a selector is shown."""
+    code = "import sys, skill_eval.cli; sys.exit('textual' in sys.modules)"
+    # The child doesn't get pytest's pythonpath setting, so point it at src/
+    env = {**os.environ, "PYTHONPATH": str(Path(__file__).parents[1] / "src")}
+    assert subprocess.run([sys.executable, "-c", code], env=env).returncode == 0
+
+
 def test_find_evals_root_from_evals_dir(tmp_path: Path) -> None:
     """find_evals_root finds root when cwd is the evals directory."""
     scenarios_dir = tmp_path / "scenarios"
@@ -1,23 +1,62 @@
 """Integration tests for CLI commands using Typer's CliRunner."""
 
-import os
+import webbrowser
+from collections.abc import Callable
 from pathlib import Path
+from typing import Any
 from unittest.mock import MagicMock, patch
 
+import pytest
 import yaml
 from typer.testing import CliRunner
 
-from skill_eval.cli import app
+from skill_eval.cli import app, run
 
 runner = CliRunner()
 
+# skill-sets.yaml payloads, serialized once at import
+_BASELINE_SKILL_SETS = yaml.dump({"sets": [{"name": "baseline", "skills": []}]}).encode()
+_TWO_SETS = yaml.dump({"sets": [{"name": "set1"}, {"name": "set2"}]}).encode()
+
+# Static grades.yaml fixtures for the report tests
+_GRADES_YAML = """\
+graded_at: '2024-01-15'
+grader: human
+results:
+  test-scenario:
+    skill-set-1: {success: true, score: 4}
+"""
+_LATEST_GRADES_YAML = """\
+results:
+  scenario:
+    skill-set: {success: true}
+"""
+
+
+def run_command(**options: Any) -> None:
+    """Call the `run` command function directly, skipping Click's parsing."""
+    defaults: dict[str, Any] = {
+        "scenarios": None,
+        "all_scenarios": False,
+        "parallel": False,
+        "workers": 4,
+        "verbose": False,
+        "base_dir": None,
+    }
+    run(**(defaults | options))
+
+
+@pytest.fixture(autouse=True)
+def _chdir_tmp(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Run every command test from its own tmp_path."""
+    monkeypatch.chdir(tmp_path)
+
 
 class TestRunCommand:
     """Tests for the 'run' command."""
 
-    def test_run_requires_scenario_or_all(self, tmp_path: Path, monkeypatch: MagicMock) -> None:
+    def test_run_requires_scenario_or_all(self, tmp_path: Path) -> None:
         """run command errors when no scenario specified and not interactive."""
-        monkeypatch.chdir(tmp_path)
         scenarios_dir = tmp_path / "scenarios"
         scenarios_dir.mkdir()
         (scenarios_dir / "test-scenario").mkdir()
@@ -28,18 +67,17 @@ class TestRunCommand:
         assert result.exit_code == 1
         assert "Specify scenario names or use --all" in result.output
 
-    def test_run_with_all_flag(self, tmp_path: Path, monkeypatch: MagicMock) -> None:
+    def test_run_with_all_flag(
+        self,
+        tmp_path: Path,
+        make_tree: Callable[[Path, dict[str, str | bytes]], None],
+        capsys: pytest.CaptureFixture[str],
+    ) -> None:
         """run command with --all runs all scenarios."""
-        monkeypatch.chdir(tmp_path)
-
-        # Create scenario
-        scenarios_dir = tmp_path / "scenarios"
-        scenario_dir = scenarios_dir / "test-scenario"
-        scenario_dir.mkdir(parents=True)
-        (scenario_dir / "prompt.txt").write_text("Do something")
-        (scenario_dir / "skill-sets.yaml").write_text(
-            yaml.dump({"sets": [{"name": "baseline", "skills": []}]})
-        )
+        make_tree(tmp_path / "scenarios", {
+            "test-scenario/prompt.txt": b"Do something",
+            "test-scenario/skill-sets.yaml": _BASELINE_SKILL_SETS,
+        })
 
         # Mock the runner to avoid actually running Claude
         with patch("skill_eval.runner.Runner") as MockRunner:
@@ -47,24 +85,19 @@ class TestRunCommand:
             mock_runner.create_run_dir.return_value = tmp_path / "runs" / "test-run"
             mock_runner.run_scenario.return_value = MagicMock(success=True, error=None)
 
-            result = runner.invoke(app, ["run", "--all"])
+            run_command(all_scenarios=True)
 
-        assert result.exit_code == 0
-        assert "Run directory:" in result.output
+        assert "Run directory:" in capsys.readouterr().out
         mock_runner.run_scenario.assert_called()
 
-    def test_run_with_specific_scenario(self, tmp_path: Path, monkeypatch: MagicMock) -> None:
+    def test_run_with_specific_scenario(
+        self, tmp_path: Path, make_tree: Callable[[Path, dict[str, str | bytes]], None]
+    ) -> None:
         """run command with scenario name runs that scenario."""
-        monkeypatch.chdir(tmp_path)
-
-        # Create scenario
-        scenarios_dir = tmp_path / "scenarios"
-        scenario_dir = scenarios_dir / "my-scenario"
-        scenario_dir.mkdir(parents=True)
-        (scenario_dir / "prompt.txt").write_text("Do something")
-        (scenario_dir / "skill-sets.yaml").write_text(
-            yaml.dump({"sets": [{"name": "baseline", "skills": []}]})
-        )
+        make_tree(tmp_path / "scenarios", {
+            "my-scenario/prompt.txt": b"Do something",
+            "my-scenario/skill-sets.yaml": _BASELINE_SKILL_SETS,
+        })
 
         with patch("skill_eval.runner.Runner") as MockRunner:
             mock_runner = MockRunner.return_value
@@ -76,48 +109,41 @@ class TestRunCommand:
         assert result.exit_code == 0
         mock_runner.run_scenario.assert_called_once()
 
-    def test_run_parallel_flag(self, tmp_path: Path, monkeypatch: MagicMock) -> None:
+    def test_run_parallel_flag(
+        self, tmp_path: Path, make_tree: Callable[[Path, dict[str, str | bytes]], None]
+    ) -> None:
         """run command with --parallel uses parallel execution."""
-        monkeypatch.chdir(tmp_path)
-
-        # Create scenario
-        scenarios_dir = tmp_path / "scenarios"
-        scenario_dir = scenarios_dir / "test-scenario"
-        scenario_dir.mkdir(parents=True)
-        (scenario_dir / "prompt.txt").write_text("Do something")
-        (scenario_dir / "skill-sets.yaml").write_text(
-            yaml.dump({"sets": [{"name": "set1"}, {"name": "set2"}]})
-        )
+        make_tree(tmp_path / "scenarios", {
+            "test-scenario/prompt.txt": b"Do something",
+            "test-scenario/skill-sets.yaml": _TWO_SETS,
+        })
 
         with patch("skill_eval.runner.Runner") as MockRunner:
             mock_runner = MockRunner.return_value
             mock_runner.create_run_dir.return_value = tmp_path / "runs" / "test-run"
             mock_runner.run_parallel.return_value = []
 
-            result = runner.invoke(app, ["run", "--all", "--parallel"])
+            run_command(all_scenarios=True, parallel=True)
 
-        assert result.exit_code == 0
         mock_runner.run_parallel.assert_called_once()
 
-    def test_run_includes_prefixed_scenarios(self, tmp_path: Path, monkeypatch: MagicMock) -> None:
+    def test_run_includes_prefixed_scenarios(
+        self, tmp_path: Path, make_tree: Callable[[Path, dict[str, str | bytes]], None]
+    ) -> None:
         """run command includes _prefixed scenarios."""
-        monkeypatch.chdir(tmp_path)
-
-        scenarios_dir = tmp_path / "scenarios"
         for name in ["regular", "_sensitive"]:
-            d = scenarios_dir / name
-            d.mkdir(parents=True)
-            (d / "prompt.txt").write_text("Do something")
-            (d / "skill-sets.yaml").write_text(yaml.dump({"sets": [{"name": "baseline"}]}))
+            make_tree(tmp_path / "scenarios", {
+                f"{name}/prompt.txt": b"Do something",
+                f"{name}/skill-sets.yaml": _BASELINE_SKILL_SETS,
+            })
 
         with patch("skill_eval.runner.Runner") as MockRunner:
             mock_runner = MockRunner.return_value
             mock_runner.create_run_dir.return_value = tmp_path / "runs" / "test-run"
             mock_runner.run_scenario.return_value = MagicMock(success=True, error=None)
 
-            result = runner.invoke(app, ["run", "--all"])
+            run_command(all_scenarios=True)
 
-        assert result.exit_code == 0
         # Should have run both scenarios
         assert mock_runner.run_scenario.call_count == 2
 
@@ -125,19 +151,17 @@ class TestRunCommand:
 class TestGradeCommand:
     """Tests for the 'grade' command."""
 
-    def test_grade_manual_creates_grades_file(self, tmp_path: Path, monkeypatch: MagicMock) -> None:
+    def test_grade_manual_creates_grades_file(self, tmp_path: Path) -> None:
         """grade command without --auto creates grades.yaml template."""
-        monkeypatch.chdir(tmp_path)
-
         # Create scenarios dir so find_evals_root can locate evals root
         (tmp_path / "scenarios").mkdir()
 
         # Create run directory structure
         runs_dir = tmp_path / "runs"
         run_dir = runs_dir / "2024-01-15-120000"
-        skill_set_dir = run_dir / "test-scenario" / "skill-set-1"
+        skill_set_dir = runs_dir / "2024-01-15-120000" / "test-scenario" / "skill-set-1"
         skill_set_dir.mkdir(parents=True)
-        (skill_set_dir / "output.md").write_text("Test output")
+        (skill_set_dir / "output.md").touch()
 
         with patch("skill_eval.cli.is_interactive", return_value=False):
             result = runner.invoke(app, ["grade"])
@@ -146,61 +170,54 @@ class TestGradeCommand:
         assert "Grades file:" in result.output
         assert (run_dir / "grades.yaml").exists()
 
-    def test_grade_with_run_id(self, tmp_path: Path, monkeypatch: MagicMock) -> None:
+    def test_grade_with_run_id(self, tmp_path: Path) -> None:
         """grade command with run_id uses that run."""
-        monkeypatch.chdir(tmp_path)
-
         # Create scenarios dir so find_evals_root can locate evals root
         (tmp_path / "scenarios").mkdir()
 
         runs_dir = tmp_path / "runs"
         for name in ["2024-01-01-100000", "2024-01-02-100000"]:
-            run_dir = runs_dir / name
-            skill_set_dir = run_dir / "test-scenario" / "skill-set-1"
+            skill_set_dir = runs_dir / name / "test-scenario" / "skill-set-1"
             skill_set_dir.mkdir(parents=True)
-            (skill_set_dir / "output.md").write_text("Output")
+            (skill_set_dir / "output.md").touch()
 
         result = runner.invoke(app, ["grade", "01-01"])
 
         assert result.exit_code == 0
         assert "2024-01-01-100000" in result.output
 
-    def test_grade_latest_flag(self, tmp_path: Path, monkeypatch: MagicMock) -> None:
+    def test_grade_latest_flag(self, tmp_path: Path) -> None:
         """grade --latest uses most recent run without prompting."""
-        monkeypatch.chdir(tmp_path)
-
         # Create scenarios dir so find_evals_root can locate evals root
         (tmp_path / "scenarios").mkdir()
 
         runs_dir = tmp_path / "runs"
         for name in ["2024-01-01-100000", "2024-01-02-100000"]:
-            run_dir = runs_dir / name
-            skill_set_dir = run_dir / "scenario" / "skill-set"
+            skill_set_dir = runs_dir / name / "scenario" / "skill-set"
             skill_set_dir.mkdir(parents=True)
-            (skill_set_dir / "output.md").write_text("Output")
+            (skill_set_dir / "output.md").touch()
 
         result = runner.invoke(app, ["grade", "--latest"])
 
         assert result.exit_code == 0
         assert "2024-01-02-100000" in result.output
 
-    def test_grade_auto_calls_grader(self, tmp_path: Path, monkeypatch: MagicMock) -> None:
+    def test_grade_auto_calls_grader(
+        self, tmp_path: Path, make_tree: Callable[[Path, dict[str, str | bytes]], None]
+    ) -> None:
         """grade --auto calls Claude grader for each output."""
-        monkeypatch.chdir(tmp_path)
-
-        # Create scenario
-        scenarios_dir = tmp_path / "scenarios"
-        scenario_dir = scenarios_dir / "test-scenario"
-        scenario_dir.mkdir(parents=True)
-        (scenario_dir / "scenario.md").write_text("# Test")
-        (scenario_dir / "prompt.txt").write_text("Do something")
+        make_tree(tmp_path / "scenarios", {
+            "test-scenario/prompt.txt": b"Do something",
+            "test-scenario/skill-sets.yaml": _BASELINE_SKILL_SETS,
+            "test-scenario/scenario.md": b"",
+        })
 
         # Create run output
         runs_dir = tmp_path / "runs"
         run_dir = runs_dir / "2024-01-15-120000"
-        skill_set_dir = run_dir / "test-scenario" / "skill-set-1"
+        skill_set_dir = runs_dir / "2024-01-15-120000" / "test-scenario" / "skill-set-1"
         skill_set_dir.mkdir(parents=True)
-        (skill_set_dir / "output.md").write_text("I did the thing")
+        (skill_set_dir / "output.md").touch()
         (skill_set_dir / "metadata.yaml").write_text(
             yaml.dump({"skills_available": ["skill-a"], "skills_invoked": ["skill-a"]})
         )
@@ -215,21 +232,21 @@ class TestGradeCommand:
         mock_grader.assert_called_once()
         assert (run_dir / "grades.yaml").exists()
 
-    def test_grade_auto_computes_skill_usage(self, tmp_path: Path, monkeypatch: MagicMock) -> None:
+    def test_grade_auto_computes_skill_usage(
+        self, tmp_path: Path, make_tree: Callable[[Path, dict[str, str | bytes]], None]
+    ) -> None:
         """grade --auto computes skill usage from metadata."""
-        monkeypatch.chdir(tmp_path)
-
-        scenarios_dir = tmp_path / "scenarios"
-        scenario_dir = scenarios_dir / "test-scenario"
-        scenario_dir.mkdir(parents=True)
-        (scenario_dir / "scenario.md").write_text("# Test")
-        (scenario_dir / "prompt.txt").write_text("Do something")
+        make_tree(tmp_path / "scenarios", {
+            "test-scenario/prompt.txt": b"Do something",
+            "test-scenario/skill-sets.yaml": _BASELINE_SKILL_SETS,
+            "test-scenario/scenario.md": b"",
+        })
 
         runs_dir = tmp_path / "runs"
         run_dir = runs_dir / "2024-01-15-120000"
-        skill_set_dir = run_dir / "test-scenario" / "skill-set-1"
+        skill_set_dir = runs_dir / "2024-01-15-120000" / "test-scenario" / "skill-set-1"
         skill_set_dir.mkdir(parents=True)
-        (skill_set_dir / "output.md").write_text("Done")
+        (skill_set_dir / "output.md").touch()
         (skill_set_dir / "metadata.yaml").write_text(
             yaml.dump({
                 "skills_available": ["skill-a", "skill-b"],
@@ -256,31 +273,19 @@ class TestGradeCommand:
 class TestReportCommand:
     """Tests for the 'report' command."""
 
-    def test_report_generates_output(self, tmp_path: Path, monkeypatch: MagicMock) -> None:
+    def test_report_generates_output(self, tmp_path: Path) -> None:
         """report command generates report file."""
-        monkeypatch.chdir(tmp_path)
-
         # Create scenarios dir so find_evals_root can locate evals root
         (tmp_path / "scenarios").mkdir()
 
         # Create run with grades
         runs_dir = tmp_path / "runs"
         run_dir = runs_dir / "2024-01-15-120000"
-        skill_set_dir = run_dir / "test-scenario" / "skill-set-1"
+        skill_set_dir = runs_dir / "2024-01-15-120000" / "test-scenario" / "skill-set-1"
         skill_set_dir.mkdir(parents=True)
-        (skill_set_dir / "output.md").write_text("Output")
-        (skill_set_dir / "metadata.yaml").write_text(yaml.dump({"tools_used": ["Read"]}))
-        (run_dir / "grades.yaml").write_text(
-            yaml.dump({
-                "graded_at": "2024-01-15",
-                "grader": "human",
-                "results": {
-                    "test-scenario": {
-                        "skill-set-1": {"success": True, "score": 4}
-                    }
-                },
-            })
-        )
+        (skill_set_dir / "output.md").touch()
+        (skill_set_dir / "metadata.yaml").write_text("tools_used: [Read]\n")
+        (run_dir / "grades.yaml").write_text(_GRADES_YAML)
 
         with patch("skill_eval.cli.is_interactive", return_value=False):
             result = runner.invoke(app, ["report"])
@@ -292,23 +297,19 @@ class TestReportCommand:
         reports_dir = tmp_path / "reports"
         assert reports_dir.exists()
 
-    def test_report_latest_flag(self, tmp_path: Path, monkeypatch: MagicMock) -> None:
+    def test_report_latest_flag(self, tmp_path: Path) -> None:
         """report --latest uses most recent run."""
-        monkeypatch.chdir(tmp_path)
-
         # Create scenarios dir so find_evals_root can locate evals root
         (tmp_path / "scenarios").mkdir()
 
         runs_dir = tmp_path / "runs"
         for name in ["2024-01-01-100000", "2024-01-02-100000"]:
             run_dir = runs_dir / name
-            ss_dir = run_dir / "scenario" / "skill-set"
+            ss_dir = runs_dir / name / "scenario" / "skill-set"
             ss_dir.mkdir(parents=True)
-            (ss_dir / "output.md").write_text("Output")
-            (ss_dir / "metadata.yaml").write_text(yaml.dump({}))
-            (run_dir / "grades.yaml").write_text(
-                yaml.dump({"results": {"scenario": {"skill-set": {"success": True}}}})
-            )
+            (ss_dir / "output.md").touch()
+            (ss_dir / "metadata.yaml").write_text("{}\n")
+            (run_dir / "grades.yaml").write_text(_LATEST_GRADES_YAML)
 
         result = runner.invoke(app, ["report", "--latest"])
 
@@ -319,18 +320,15 @@ class TestReportCommand:
 class TestReviewCommand:
     """Tests for the 'review' command."""
 
-    def test_review_finds_transcripts(self, tmp_path: Path, monkeypatch: MagicMock) -> None:
+    def test_review_finds_transcripts(self, tmp_path: Path) -> None:
         """review command finds and reports transcript files."""
-        monkeypatch.chdir(tmp_path)
-
         # Create scenarios dir so find_evals_root can locate evals root
         (tmp_path / "scenarios").mkdir()
-
         runs_dir = tmp_path / "runs"
-        run_dir = runs_dir / "2024-01-15-120000"
-        transcript_dir = run_dir / "test-scenario" / "skill-set-1" / "transcript"
-        transcript_dir.mkdir(parents=True)
-        (transcript_dir / "index.html").write_text("<html></html>")
+        for name in ["2024-01-01-100000", "2024-01-02-100000"]:
+            transcript_dir = runs_dir / name / "scenario" / "skill-set" / "transcript"
+            transcript_dir.mkdir(parents=True)
+            (transcript_dir / "index.html").touch()
 
         with patch("skill_eval.cli.is_interactive", return_value=False):
             with patch("webbrowser.open") as mock_open:
@@ -340,10 +338,73 @@ class TestReviewCommand:
         assert "Opening 1 transcript" in result.output
         mock_open.assert_called_once()
 
-    def test_review_no_transcripts_errors(self, tmp_path: Path, monkeypatch: MagicMock) -> None:
-        """review command errors when no transcripts found."""
-        monkeypatch.chdir(tmp_path)
+    def test_review_launches_browser_once_for_many_transcripts(self, tmp_path: Path) -> None:
+        """review passes every transcript URL to a single browser launch."""
+        (tmp_path / "scenarios").mkdir()
+        runs_dir = tmp_path / "runs"
+        for skill_set in ["set-a", "set-b", "set-c"]:
+            transcript_dir = runs_dir / "2024-01-15-120000" / "scenario" / skill_set / "transcript"
+            transcript_dir.mkdir(parents=True)
+            (transcript_dir / "index.html").touch()
+
+        with (
+            patch("skill_eval.cli.is_interactive", return_value=False),
+            patch("webbrowser.get", return_value=webbrowser.Mozilla("firefox")),
+            patch("webbrowser.open") as mock_open,
+            patch("subprocess.Popen") as mock_popen,
+        ):
+            result = runner.invoke(app, ["review"])
 
+        assert result.exit_code == 0
+        assert "Opening 3 transcript" in result.output
+        mock_open.assert_not_called()
+        args = mock_popen.call_args.args[0]
+        assert args[0] == "firefox"
+        assert [a.split("/")[-3] for a in args[1:]] == ["set-a", "set-b", "set-c"]
+
+    def test_review_opens_each_transcript_without_known_browser(self, tmp_path: Path) -> None:
+        """review falls back to one webbrowser.open per transcript."""
+        (tmp_path / "scenarios").mkdir()
+        runs_dir = tmp_path / "runs"
+        for skill_set in ["set-a", "set-b"]:
+            transcript_dir = runs_dir / "2024-01-15-120000" / "scenario" / skill_set / "transcript"
+            transcript_dir.mkdir(parents=True)
+            (transcript_dir / "index.html").touch()
+
+        with (
+            patch("skill_eval.cli.is_interactive", return_value=False),
+            patch("webbrowser.get", side_effect=webbrowser.Error),
+            patch("webbrowser.open") as mock_open,
+        ):
+            result = runner.invoke(app, ["review"])
+
+        assert result.exit_code == 0
+        assert "Opening 2 transcript" in result.output
+        assert mock_open.call_count == 2
+
+    def test_review_opens_each_transcript_in_terminal_browser(self, tmp_path: Path) -> None:
+        """review doesn't batch URLs into a terminal browser, which needs the TTY."""
+        (tmp_path / "scenarios").mkdir()
+        runs_dir = tmp_path / "runs"
+        for skill_set in ["set-a", "set-b"]:
+            transcript_dir = runs_dir / "2024-01-15-120000" / "scenario" / skill_set / "transcript"
+            transcript_dir.mkdir(parents=True)
+            (transcript_dir / "index.html").touch()
+
+        with (
+            patch("skill_eval.cli.is_interactive", return_value=False),
+            patch("webbrowser.get", return_value=webbrowser.Elinks("elinks")),
+            patch("webbrowser.open") as mock_open,
+            patch("subprocess.Popen") as mock_popen,
+        ):
+            result = runner.invoke(app, ["review"])
+
+        assert result.exit_code == 0
+        mock_popen.assert_not_called()
+        assert mock_open.call_count == 2
+
+    def test_review_no_transcripts_errors(self, tmp_path: Path) -> None:
+        """review command errors when no transcripts found."""
         # Create scenarios dir so find_evals_root can locate evals root
         (tmp_path / "scenarios").mkdir()
 
@@ -357,19 +418,15 @@ class TestReviewCommand:
         assert result.exit_code == 1
         assert "No transcripts found" in result.output
 
-    def test_review_latest_flag(self, tmp_path: Path, monkeypatch: MagicMock) -> None:
+    def test_review_latest_flag(self, tmp_path: Path) -> None:
         """review --latest uses most recent run."""
-        monkeypatch.chdir(tmp_path)
-
         # Create scenarios dir so find_evals_root can locate evals root
         (tmp_path / "scenarios").mkdir()
-
         runs_dir = tmp_path / "runs"
         for name in ["2024-01-01-100000", "2024-01-02-100000"]:
-            run_dir = runs_dir / name
-            transcript_dir = run_dir / "scenario" / "skill-set" / "transcript"
+            transcript_dir = runs_dir / name / "scenario" / "skill-set" / "transcript"
             transcript_dir.mkdir(parents=True)
-            (transcript_dir / "index.html").write_text("<html></html>")
+            (transcript_dir / "index.html").touch()
 
         with patch("webbrowser.open"):
             result = runner.invoke(app, ["review", "--latest"])
@@ -381,18 +438,15 @@ class TestReviewCommand:
 class TestRootDiscovery:
     """Tests that commands find evals root automatically."""
 
-    def test_run_finds_evals_root_from_parent(self, tmp_path: Path, monkeypatch: MagicMock) -> None:
+    def test_run_finds_evals_root_from_parent(
+        self, tmp_path: Path, make_tree: Callable[[Path, dict[str, str | bytes]], None]
+    ) -> None:
         """run command works when cwd is parent of evals dir."""
         evals_dir = tmp_path / "evals"
-        scenarios_dir = evals_dir / "scenarios"
-        scenario_dir = scenarios_dir / "test-scenario"
-        scenario_dir.mkdir(parents=True)
-        (scenario_dir / "prompt.txt").write_text("Do something")
-        (scenario_dir / "skill-sets.yaml").write_text(
-            yaml.dump({"sets": [{"name": "baseline", "skills": []}]})
-        )
-
-        monkeypatch.chdir(tmp_path)
+        make_tree(evals_dir / "scenarios", {
+            "test-scenario/prompt.txt": b"Do something",
+            "test-scenario/skill-sets.yaml": _BASELINE_SKILL_SETS,
+        })
 
         with patch("skill_eval.runner.Runner") as MockRunner:
             mock_runner = MockRunner.return_value
@@ -408,9 +462,8 @@ class TestRootDiscovery:
 class TestNewCommand:
     """Tests for the 'new' command."""
 
-    def test_new_creates_scenario(self, tmp_path: Path, monkeypatch: MagicMock) -> None:
+    def test_new_creates_scenario(self, tmp_path: Path) -> None:
         """new command creates scenario directory with all template files."""
-        monkeypatch.chdir(tmp_path)
         (tmp_path / "scenarios").mkdir()
 
         result = runner.invoke(app, ["new", "my-test-scenario"])
@@ -424,9 +477,8 @@ class TestNewCommand:
         assert (scenario_dir / ".env").exists()
         assert "Created scenario" in result.output
 
-    def test_new_shows_files_to_edit(self, tmp_path: Path, monkeypatch: MagicMock) -> None:
+    def test_new_shows_files_to_edit(self, tmp_path: Path) -> None:
         """new command prints summary of files to edit."""
-        monkeypatch.chdir(tmp_path)
         (tmp_path / "scenarios").mkdir()
 
         result = runner.invoke(app, ["new", "my-test"])
@@ -436,18 +488,16 @@ class TestNewCommand:
         assert "skill-sets.yaml" in result.output
         assert ".env" in result.output
 
-    def test_new_rejects_invalid_name(self, tmp_path: Path, monkeypatch: MagicMock) -> None:
+    def test_new_rejects_invalid_name(self, tmp_path: Path) -> None:
         """new command rejects invalid scenario names."""
-        monkeypatch.chdir(tmp_path)
         (tmp_path / "scenarios").mkdir()
 
         result = runner.invoke(app, ["new", "My_Scenario"])
 
         assert result.exit_code == 1
 
-    def test_new_errors_if_exists(self, tmp_path: Path, monkeypatch: MagicMock) -> None:
+    def test_new_errors_if_exists(self, tmp_path: Path) -> None:
         """new command errors when scenario already exists."""
-        monkeypatch.chdir(tmp_path)
         (tmp_path / "scenarios" / "existing").mkdir(parents=True)
 
         result = runner.invoke(app, ["new", "existing"])
@@ -455,36 +505,33 @@ class TestNewCommand:
         assert result.exit_code == 1
         assert "already exists" in result.output
 
-    def test_new_with_context_file(self, tmp_path: Path, monkeypatch: MagicMock) -> None:
+    def test_new_with_context_file(self, tmp_path: Path) -> None:
         """new command copies context file."""
-        monkeypatch.chdir(tmp_path)
         (tmp_path / "scenarios").mkdir()
         src = tmp_path / "models.yml"
-        src.write_text("version: 2")
+        src.touch()
 
         result = runner.invoke(app, ["new", "my-test", "--context", str(src)])
 
         assert result.exit_code == 0
         assert (tmp_path / "scenarios" / "my-test" / "context" / "models.yml").exists()
 
-    def test_new_with_context_directory(self, tmp_path: Path, monkeypatch: MagicMock) -> None:
+    def test_new_with_context_directory(self, tmp_path: Path) -> None:
         """new command copies context directory tree."""
-        monkeypatch.chdir(tmp_path)
         (tmp_path / "scenarios").mkdir()
         models = tmp_path / "models"
         models.mkdir()
-        (models / "a.sql").write_text("SELECT 1")
+        (models / "a.sql").touch()
 
         result = runner.invoke(app, ["new", "my-test", "--context", str(models)])
 
         assert result.exit_code == 0
         assert (tmp_path / "scenarios" / "my-test" / "context" / "models" / "a.sql").exists()
 
-    def test_new_with_base_dir(self, tmp_path: Path, monkeypatch: MagicMock) -> None:
+    def test_new_with_base_dir(self, tmp_path: Path) -> None:
         """new command uses --base-dir when provided."""
         custom_dir = tmp_path / "custom"
         (custom_dir / "scenarios").mkdir(parents=True)
-        monkeypatch.chdir(tmp_path)
 
         result = runner.invoke(app, ["new", "my-test", "--base-dir", str(custom_dir)])
 
@@ -495,9 +542,8 @@ class TestNewCommand:
 class TestBaseDirOption:
     """Tests that --base-dir works across commands."""
 
-    def test_new_defaults_to_cwd_evals(self, tmp_path: Path, monkeypatch: MagicMock) -> None:
+    def test_new_defaults_to_cwd_evals(self, tmp_path: Path) -> None:
         """new command defaults to cwd/evals/ when no evals root found."""
-        monkeypatch.chdir(tmp_path)
         # No scenarios/ directory exists anywhere
 
         result = runner.invoke(app, ["new", "my-test"])
@@ -505,17 +551,15 @@ class TestBaseDirOption:
         assert result.exit_code == 0
         assert (tmp_path / "evals" / "scenarios" / "my-test" / "scenario.md").exists()
 
-    def test_run_with_base_dir(self, tmp_path: Path, monkeypatch: MagicMock) -> None:
+    def test_run_with_base_dir(
+        self, tmp_path: Path, make_tree: Callable[[Path, dict[str, str | bytes]], None]
+    ) -> None:
         """run command uses --base-dir when provided."""
         custom_dir = tmp_path / "custom-evals"
-        scenarios_dir = custom_dir / "scenarios"
-        scenario_dir = scenarios_dir / "test-scenario"
-        scenario_dir.mkdir(parents=True)
-        (scenario_dir / "prompt.txt").write_text("Do something")
-        (scenario_dir / "skill-sets.yaml").write_text(
-            yaml.dump({"sets": [{"name": "baseline", "skills": []}]})
-        )
-        monkeypatch.chdir(tmp_path)
+        make_tree(custom_dir / "scenarios", {
+            "test-scenario/prompt.txt": b"Do something",
+            "test-scenario/skill-sets.yaml": _BASELINE_SKILL_SETS,
+        })
 
         with patch("skill_eval.runner.Runner") as MockRunner:
             mock_runner = MockRunner.return_value
@@ -527,15 +571,13 @@ class TestBaseDirOption:
         assert result.exit_code == 0
         mock_runner.run_scenario.assert_called()
 
-    def test_review_with_base_dir(self, tmp_path: Path, monkeypatch: MagicMock) -> None:
+    def test_review_with_base_dir(self, tmp_path: Path) -> None:
         """review command uses --base-dir when provided."""
         custom_dir = tmp_path / "my-evals"
         runs_dir = custom_dir / "runs"
-        run_dir = runs_dir / "2024-01-15-120000"
-        transcript_dir = run_dir / "scenario" / "skill-set" / "transcript"
+        transcript_dir = runs_dir / "2024-01-15-120000" / "scenario" / "skill-set" / "transcript"
         transcript_dir.mkdir(parents=True)
-        (transcript_dir / "index.html").write_text("<html></html>")
-        monkeypatch.chdir(tmp_path)
+        (transcript_dir / "index.html").touch()
 
         with patch("webbrowser.open"):
             result = runner.invoke(app, ["review", "--base-dir", str(custom_dir)])
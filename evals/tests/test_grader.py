@@ -1,8 +1,12 @@
 """Tests for skill_eval grader."""
 
+import os
+import threading
+from collections.abc import Callable
 from pathlib import Path
 from unittest.mock import patch
 
+import pytest
 import yaml
 
 from skill_eval.grader import (
@@ -10,89 +14,172 @@ from skill_eval.grader import (
     build_grading_prompt,
     call_claude_grader,
     compute_skill_usage,
+    load_metadata,
     parse_grade_response,
 )
 from skill_eval.models import Grade
 
-
-def test_build_grading_prompt_includes_all_sections(tmp_path: Path) -> None:
-    """Grading prompt includes task, criteria, output, tools, and files."""
-    # Create scenario directory
-    scenario_dir = tmp_path / "scenarios" / "test-scenario"
+# metadata.yaml payloads, rendered once at import
+_TOOLS_USED_READ = b"tools_used:\n- Read\n"
+_NO_TOOLS_USED = b"tools_used: []\n"
+_META_FULL = yaml.dump({
+    "tools_used": ["Read", "Edit"],
+    "skills_available": ["debugging"],
+    "skills_invoked": [],
+    "mcp_servers": [{"name": "dbt", "status": "connected"}],
+}).encode()
+_META_SKILLS = yaml.dump({
+    "tools_used": ["Skill"],
+    "skills_available": ["skill-a", "skill-b"],
+    "skills_invoked": ["skill-a"],
+}).encode()
+
+
+@pytest.fixture(scope="module")
+def grading_dirs(tmp_path_factory: pytest.TempPathFactory) -> dict[str, tuple[Path, Path]]:
+    """Scenario/output directory pairs for the grading prompt tests, built once."""
+    root = tmp_path_factory.mktemp("grading")
+
+    # Full scenario: every input file present, plus a modified file
+    scenario_dir = root / "scenarios" / "test-scenario"
     scenario_dir.mkdir(parents=True)
     (scenario_dir / "scenario.md").write_text("# Test Scenario\n\nExpected: Fix the bug.")
     (scenario_dir / "prompt.txt").write_text("Please fix the bug in the code.")
-
-    # Create output directory
-    output_dir = tmp_path / "runs" / "run-1" / "test-scenario" / "skill-set-1"
+    output_dir = root / "runs" / "run-1" / "test-scenario" / "skill-set-1"
     output_dir.mkdir(parents=True)
     (output_dir / "output.md").write_text("I found and fixed the bug.")
-    (output_dir / "metadata.yaml").write_text(
-        yaml.dump({
-            "tools_used": ["Read", "Edit"],
-            "skills_available": ["debugging"],
-            "skills_invoked": [],
-            "mcp_servers": [{"name": "dbt", "status": "connected"}],
-        })
-    )
-
-    # Create modified files
-    changes_dir = output_dir / "changes"
-    changes_dir.mkdir()
-    (changes_dir / "fixed_file.py").write_text("# fixed")
+    (output_dir / "metadata.yaml").write_bytes(_META_FULL)
+    (output_dir / "changes").mkdir()
+    (output_dir / "changes" / "fixed_file.py").write_text("# fixed")
+    full = (scenario_dir, output_dir)
+
+    # Empty scenario and output directories
+    scenario_dir = root / "scenarios" / "empty"
+    scenario_dir.mkdir()
+    output_dir = root / "runs" / "run-1" / "empty" / "skill-set"
+    output_dir.mkdir(parents=True)
+    empty = (scenario_dir, output_dir)
+
+    # Some available skills not invoked
+    scenario_dir = root / "scenarios" / "test"
+    scenario_dir.mkdir()
+    (scenario_dir / "prompt.txt").write_text("Do something")
+    output_dir = root / "runs" / "run-1" / "test" / "skill-set"
+    output_dir.mkdir(parents=True)
+    (output_dir / "output.md").write_text("Done")
+    (output_dir / "metadata.yaml").write_bytes(_META_SKILLS)
+    skills = (scenario_dir, output_dir)
+
+    return {"full": full, "empty": empty, "skills": skills}
+
+
+@pytest.mark.parametrize(
+    ("case", "expected"),
+    [
+        pytest.param(
+            "full",
+            [
+                "Please fix the bug in the code.",  # Task
+                "Fix the bug",  # Criteria
+                "I found and fixed the bug.",  # Output
+                "Read",  # Tools used
+                "Edit",
+                "debugging",  # Skills available
+                "dbt",  # MCP server
+                "fixed_file.py",  # Modified files
+            ],
+            id="includes-all-sections",
+        ),
+        pytest.param(
+            "empty",
+            [
+                "No scenario description provided",
+                "No prompt provided",
+                "No output recorded",
+                "No files modified",
+            ],
+            id="handles-missing-files",
+        ),
+        pytest.param(
+            "skills",
+            ["Skills available:", "skill-a", "skill-b", "Skills actually invoked:"],
+            id="shows-skills-availability",
+        ),
+    ],
+)
+def test_build_grading_prompt(
+    grading_dirs: dict[str, tuple[Path, Path]], case: str, expected: list[str]
+) -> None:
+    """Grading prompt includes each section, with placeholders for missing inputs."""
+    scenario_dir, output_dir = grading_dirs[case]
 
     prompt = build_grading_prompt(scenario_dir, output_dir)
 
-    # Check all sections are present
-    assert "Please fix the bug in the code." in prompt  # Task
-    assert "Fix the bug" in prompt  # Criteria
-    assert "I found and fixed the bug." in prompt  # Output
-    assert "Read" in prompt  # Tools used
-    assert "Edit" in prompt
-    assert "debugging" in prompt  # Skills available
-    assert "dbt" in prompt  # MCP server
-    assert "fixed_file.py" in prompt  # Modified files
+    for text in expected:
+        assert text in prompt
 
 
-def test_build_grading_prompt_handles_missing_files(tmp_path: Path) -> None:
-    """Grading prompt handles missing scenario/output files gracefully."""
-    scenario_dir = tmp_path / "scenarios" / "empty"
+def test_build_grading_prompt_reads_scenario_once(tmp_path: Path) -> None:
+    """Skill sets of the same scenario reuse the loaded scenario files."""
+    scenario_dir = tmp_path / "scenarios" / "cached"
     scenario_dir.mkdir(parents=True)
+    (scenario_dir / "prompt.txt").write_text("Do something")
+
+    with patch.object(Path, "read_text", autospec=True, side_effect=Path.read_text) as mock_read:
+        for skill_set in ["set-1", "set-2"]:
+            output_dir = tmp_path / "runs" / "run-1" / "cached" / skill_set
+            output_dir.mkdir(parents=True)
+            assert "Do something" in build_grading_prompt(scenario_dir, output_dir)
 
-    output_dir = tmp_path / "runs" / "run-1" / "empty" / "skill-set"
+    prompt_reads = [c for c in mock_read.call_args_list if c.args[0].name == "prompt.txt"]
+    assert len(prompt_reads) == 1
+
+
+def test_build_grading_prompt_rereads_edited_scenario(tmp_path: Path) -> None:
+    """An edited prompt.txt is picked up by the next grading prompt."""
+    scenario_dir = tmp_path / "scenarios" / "edited"
+    scenario_dir.mkdir(parents=True)
+    prompt_file = scenario_dir / "prompt.txt"
+    prompt_file.write_text("First version")
+    output_dir = tmp_path / "runs" / "run-1" / "edited" / "skill-set"
     output_dir.mkdir(parents=True)
 
-    prompt = build_grading_prompt(scenario_dir, output_dir)
+    assert "First version" in build_grading_prompt(scenario_dir, output_dir)
 
-    assert "No scenario description provided" in prompt
-    assert "No prompt provided" in prompt
-    assert "No output recorded" in prompt
-    assert "No files modified" in prompt
+    prompt_file.write_text("Second version")
+    mtime_ns = prompt_file.stat().st_mtime_ns + 1_000_000_000
+    os.utime(prompt_file, ns=(mtime_ns, mtime_ns))  # coarse-mtime filesystems
 
+    assert "Second version" in build_grading_prompt(scenario_dir, output_dir)
 
-def test_build_grading_prompt_shows_skills_availability(tmp_path: Path) -> None:
-    """Grading prompt clearly shows available vs invoked skills."""
-    scenario_dir = tmp_path / "scenarios" / "test"
-    scenario_dir.mkdir(parents=True)
-    (scenario_dir / "prompt.txt").write_text("Do something")
 
-    output_dir = tmp_path / "runs" / "run-1" / "test" / "skill-set"
-    output_dir.mkdir(parents=True)
-    (output_dir / "output.md").write_text("Done")
-    (output_dir / "metadata.yaml").write_text(
-        yaml.dump({
-            "tools_used": ["Skill"],
-            "skills_available": ["skill-a", "skill-b"],
-            "skills_invoked": ["skill-a"],
-        })
-    )
+def test_build_grading_prompt_lists_nested_changes(tmp_path: Path) -> None:
+    """Modified files in nested directories are listed relative to changes/."""
+    scenario_dir = tmp_path / "scenarios" / "nested"
+    scenario_dir.mkdir(parents=True)
+    output_dir = tmp_path / "runs" / "run-1" / "nested" / "skill-set"
+    (output_dir / "changes" / "models" / "staging").mkdir(parents=True)
+    (output_dir / "changes" / "models" / "staging" / "stg_orders.sql").touch()
+    (output_dir / "changes" / "dbt_project.yml").touch()
 
     prompt = build_grading_prompt(scenario_dir, output_dir)
 
-    assert "Skills available:" in prompt
-    assert "skill-a" in prompt
-    assert "skill-b" in prompt
-    assert "Skills actually invoked:" in prompt
+    assert "- dbt_project.yml\n- models/staging/stg_orders.sql" in prompt
+
+
+def test_load_metadata_reads_yaml(tmp_path: Path) -> None:
+    """load_metadata parses metadata.yaml from an output directory."""
+    (tmp_path / "metadata.yaml").write_bytes(_TOOLS_USED_READ)
+
+    assert load_metadata(tmp_path) == {"tools_used": ["Read"]}
+
+
+def test_load_metadata_handles_missing_or_empty(tmp_path: Path) -> None:
+    """load_metadata returns an empty dict for missing or empty files."""
+    assert load_metadata(tmp_path) == {}
+
+    (tmp_path / "metadata.yaml").write_text("")
+    assert load_metadata(tmp_path) == {}
 
 
 def test_parse_grade_response_parses_yaml(tmp_path: Path) -> None:
@@ -170,10 +257,11 @@ def test_parse_grade_response_handles_non_dict_yaml(tmp_path: Path) -> None:
 def test_call_claude_grader_builds_correct_command(tmp_path: Path) -> None:
     """Claude grader calls CLI with correct arguments."""
     with patch("skill_eval.grader.subprocess.run") as mock_run:
-        mock_run.return_value.stdout = "success: true\nscore: 5"
+        mock_run.return_value.stdout = b"success: true\nscore: 5\n"
 
-        call_claude_grader("Test prompt")
+        result = call_claude_grader("Test prompt")
 
+        assert result == "success: true\nscore: 5"
         mock_run.assert_called_once()
         cmd = mock_run.call_args[0][0]
         assert cmd[0] == "claude"
@@ -182,6 +270,16 @@ def test_call_claude_grader_builds_correct_command(tmp_path: Path) -> None:
         assert "Test prompt" in cmd
 
 
+def test_call_claude_grader_replaces_invalid_utf8(tmp_path: Path) -> None:
+    """Claude grader output with invalid UTF-8 is still returned."""
+    with patch("skill_eval.grader.subprocess.run") as mock_run:
+        mock_run.return_value.stdout = b"success: true\nnotes: caf\xe9"
+
+        result = call_claude_grader("Test prompt")
+
+    assert result == "success: true\nnotes: caf\ufffd"
+
+
 def test_call_claude_grader_handles_timeout(tmp_path: Path) -> None:
     """Claude grader handles timeout gracefully."""
     import subprocess
@@ -194,31 +292,34 @@ def test_call_claude_grader_handles_timeout(tmp_path: Path) -> None:
         assert "timeout" in result.lower()
 
 
-def test_auto_grade_run_grades_all_combinations(tmp_path: Path) -> None:
+def test_auto_grade_run_grades_all_combinations(
+    tmp_path: Path, make_tree: Callable[[Path, dict[str, str | bytes]], None]
+) -> None:
     """Auto-grade processes all scenario/skill-set combinations."""
-    # Setup scenarios
     scenarios_dir = tmp_path / "scenarios"
-    for scenario in ["scenario-a", "scenario-b"]:
-        s_dir = scenarios_dir / scenario
-        s_dir.mkdir(parents=True)
-        (s_dir / "scenario.md").write_text(f"# {scenario}")
-        (s_dir / "prompt.txt").write_text(f"Task for {scenario}")
-
-    # Setup run outputs
     run_dir = tmp_path / "runs" / "test-run"
+    files: dict[str, str | bytes] = {}
     for scenario in ["scenario-a", "scenario-b"]:
+        # Scenario definition
+        files[f"scenarios/{scenario}/scenario.md"] = f"# {scenario}"
+        files[f"scenarios/{scenario}/prompt.txt"] = f"Task for {scenario}"
+        # Run outputs
         for skill_set in ["set-1", "set-2"]:
-            out_dir = run_dir / scenario / skill_set
-            out_dir.mkdir(parents=True)
-            (out_dir / "output.md").write_text(f"Output for {scenario}/{skill_set}")
-            (out_dir / "metadata.yaml").write_text(yaml.dump({"tools_used": ["Read"]}))
+            files[f"runs/test-run/{scenario}/{skill_set}/output.md"] = f"Output for {scenario}/{skill_set}"
+            files[f"runs/test-run/{scenario}/{skill_set}/metadata.yaml"] = _TOOLS_USED_READ
+    make_tree(tmp_path, files)
+
+    # Mock Claude responses; the barrier only opens if all four calls overlap
+    barrier = threading.Barrier(4, timeout=5)
 
-    # Mock Claude responses
     def mock_grader(prompt: str) -> str:
+        barrier.wait()
         return "success: true\nscore: 4\ntool_usage: appropriate\nnotes: Good"
 
-    with patch("skill_eval.grader.call_claude_grader", side_effect=mock_grader):
-        grades = auto_grade_run(run_dir, scenarios_dir)
+    with patch("skill_eval.grader.call_claude_grader", side_effect=mock_grader) as mock_call:
+        grades = auto_grade_run(run_dir, scenarios_dir, max_workers=4)
+
+    assert mock_call.call_count == 4
 
     # Verify structure
     assert grades["grader"] == "claude-auto"
@@ -227,26 +328,26 @@ def test_auto_grade_run_grades_all_combinations(tmp_path: Path) -> None:
     assert "scenario-b" in grades["results"]
     assert "set-1" in grades["results"]["scenario-a"]
     assert "set-2" in grades["results"]["scenario-a"]
+    assert list(grades["results"]["scenario-b"]) == ["set-1", "set-2"]
     assert grades["results"]["scenario-a"]["set-1"]["success"] is True
     assert grades["results"]["scenario-a"]["set-1"]["score"] == 4
 
 
-def test_auto_grade_run_skips_hidden_dirs(tmp_path: Path) -> None:
+def test_auto_grade_run_skips_hidden_dirs(
+    tmp_path: Path, make_tree: Callable[[Path, dict[str, str | bytes]], None]
+) -> None:
     """Auto-grade skips hidden directories like .DS_Store."""
     scenarios_dir = tmp_path / "scenarios"
-    scenario_dir = scenarios_dir / "test"
-    scenario_dir.mkdir(parents=True)
-    (scenario_dir / "scenario.md").write_text("# Test")
-    (scenario_dir / "prompt.txt").write_text("Do something")
-
     run_dir = tmp_path / "runs" / "test-run"
+    make_tree(tmp_path, {
+        "scenarios/test/scenario.md": "# Test",
+        "scenarios/test/prompt.txt": "Do something",
+        # Actual output
+        "runs/test-run/test/skill-set/output.md": "Done",
+        "runs/test-run/test/skill-set/metadata.yaml": _NO_TOOLS_USED,
+    })
     # Create hidden dir that should be skipped
-    (run_dir / ".DS_Store").mkdir(parents=True)
-    # Create actual output
-    out_dir = run_dir / "test" / "skill-set"
-    out_dir.mkdir(parents=True)
-    (out_dir / "output.md").write_text("Done")
-    (out_dir / "metadata.yaml").write_text(yaml.dump({"tools_used": []}))
+    (run_dir / ".DS_Store").mkdir()
 
     with patch("skill_eval.grader.call_claude_grader", return_value="success: true\nscore: 3"):
         grades = auto_grade_run(run_dir, scenarios_dir)
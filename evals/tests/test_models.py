@@ -1,18 +1,12 @@
 """Tests for skill_eval data models."""
 
+from collections.abc import Callable
 from pathlib import Path
 
 from skill_eval.models import load_scenario
 
-
-def test_load_scenario_parses_skill_sets(tmp_path: Path) -> None:
-    """Scenario loads skill-sets.yaml correctly."""
-    scenario_dir = tmp_path / "test-scenario"
-    scenario_dir.mkdir()
-    (scenario_dir / "scenario.md").write_text("# Test")
-    (scenario_dir / "prompt.txt").write_text("Fix the bug")
-    (scenario_dir / "skill-sets.yaml").write_text(
-        """
+# skill-sets.yaml payloads
+_SKILL_SETS_BASIC = b"""\
 sets:
   - name: no-skills
     skills: []
@@ -20,7 +14,67 @@ sets:
     skills:
       - debugging-dbt-errors/baseline.md
 """
-    )
+_SKILL_SETS_MCP = b"""\
+sets:
+  - name: with-mcp
+    skills: []
+    mcp_servers:
+      dbt:
+        command: uvx
+        args:
+          - --env-file
+          - .env
+          - dbt-mcp@latest
+"""
+_SKILL_SETS_ALLOWED_TOOLS = b"""\
+sets:
+  - name: restricted
+    skills: []
+    allowed_tools:
+      - Read
+      - Glob
+      - Grep
+      - Bash(git:*)
+"""
+_SKILL_SETS_EXTRA_PROMPT = b"""\
+sets:
+  - name: no-extra
+    skills: []
+  - name: with-extra
+    skills: []
+    extra_prompt: Check if any skill can help with this task.
+"""
+_SKILL_SETS_SETUP = b"""\
+sets:
+  - name: no-setup
+    skills: []
+  - name: with-setup
+    setup:
+      - npx @anthropic-ai/claude-code-skills add https://example.com/skill
+      - echo "ready"
+    skills: []
+"""
+_SKILL_SETS_MULTILINE_PROMPT = b"""\
+sets:
+  - name: with-multiline
+    skills: []
+    extra_prompt: |
+      Before starting:
+      1. Check if any skill can help
+      2. Use the MCP server if available
+"""
+
+
+def test_load_scenario_parses_skill_sets(
+    tmp_path: Path, make_tree: Callable[[Path, dict[str, str | bytes]], None]
+) -> None:
+    """Scenario loads skill-sets.yaml correctly."""
+    scenario_dir = tmp_path / "test-scenario"
+    make_tree(scenario_dir, {
+        "scenario.md": "# Test",
+        "prompt.txt": "Fix the bug",
+        "skill-sets.yaml": _SKILL_SETS_BASIC,
+    })
 
     scenario = load_scenario(scenario_dir)
 
@@ -33,26 +87,16 @@ sets:
     assert scenario.skill_sets[1].skills == ["debugging-dbt-errors/baseline.md"]
 
 
-def test_load_scenario_parses_mcp_servers(tmp_path: Path) -> None:
+def test_load_scenario_parses_mcp_servers(
+    tmp_path: Path, make_tree: Callable[[Path, dict[str, str | bytes]], None]
+) -> None:
     """Scenario loads mcp_servers from skill-sets.yaml."""
     scenario_dir = tmp_path / "test-scenario"
-    scenario_dir.mkdir()
-    (scenario_dir / "scenario.md").write_text("# Test")
-    (scenario_dir / "prompt.txt").write_text("Debug job")
-    (scenario_dir / "skill-sets.yaml").write_text(
-        """
-sets:
-  - name: with-mcp
-    skills: []
-    mcp_servers:
-      dbt:
-        command: uvx
-        args:
-          - --env-file
-          - .env
-          - dbt-mcp@latest
-"""
-    )
+    make_tree(scenario_dir, {
+        "scenario.md": "# Test",
+        "prompt.txt": "Debug job",
+        "skill-sets.yaml": _SKILL_SETS_MCP,
+    })
 
     scenario = load_scenario(scenario_dir)
 
@@ -64,24 +108,16 @@ sets:
     assert "--env-file" in skill_set.mcp_servers["dbt"]["args"]
 
 
-def test_load_scenario_parses_allowed_tools(tmp_path: Path) -> None:
+def test_load_scenario_parses_allowed_tools(
+    tmp_path: Path, make_tree: Callable[[Path, dict[str, str | bytes]], None]
+) -> None:
     """Scenario loads allowed_tools from skill-sets.yaml."""
     scenario_dir = tmp_path / "test-scenario"
-    scenario_dir.mkdir()
-    (scenario_dir / "scenario.md").write_text("# Test")
-    (scenario_dir / "prompt.txt").write_text("Fix bug")
-    (scenario_dir / "skill-sets.yaml").write_text(
-        """
-sets:
-  - name: restricted
-    skills: []
-    allowed_tools:
-      - Read
-      - Glob
-      - Grep
-      - Bash(git:*)
-"""
-    )
+    make_tree(scenario_dir, {
+        "scenario.md": "# Test",
+        "prompt.txt": "Fix bug",
+        "skill-sets.yaml": _SKILL_SETS_ALLOWED_TOOLS,
+    })
 
     scenario = load_scenario(scenario_dir)
 
@@ -89,22 +125,16 @@ sets:
     assert skill_set.allowed_tools == ["Read", "Glob", "Grep", "Bash(git:*)"]
 
 
-def test_load_scenario_parses_extra_prompt(tmp_path: Path) -> None:
+def test_load_scenario_parses_extra_prompt(
+    tmp_path: Path, make_tree: Callable[[Path, dict[str, str | bytes]], None]
+) -> None:
     """Scenario loads extra_prompt from skill-sets.yaml."""
     scenario_dir = tmp_path / "test-scenario"
-    scenario_dir.mkdir()
-    (scenario_dir / "scenario.md").write_text("# Test")
-    (scenario_dir / "prompt.txt").write_text("Fix the bug")
-    (scenario_dir / "skill-sets.yaml").write_text(
-        """
-sets:
-  - name: no-extra
-    skills: []
-  - name: with-extra
-    skills: []
-    extra_prompt: Check if any skill can help with this task.
-"""
-    )
+    make_tree(scenario_dir, {
+        "scenario.md": "# Test",
+        "prompt.txt": "Fix the bug",
+        "skill-sets.yaml": _SKILL_SETS_EXTRA_PROMPT,
+    })
 
     scenario = load_scenario(scenario_dir)
 
@@ -112,24 +142,16 @@ sets:
     assert scenario.skill_sets[1].extra_prompt == "Check if any skill can help with this task."
 
 
-def test_load_scenario_parses_setup_commands(tmp_path: Path) -> None:
+def test_load_scenario_parses_setup_commands(
+    tmp_path: Path, make_tree: Callable[[Path, dict[str, str | bytes]], None]
+) -> None:
     """Scenario loads setup commands from skill-sets.yaml."""
     scenario_dir = tmp_path / "test-scenario"
-    scenario_dir.mkdir()
-    (scenario_dir / "scenario.md").write_text("# Test")
-    (scenario_dir / "prompt.txt").write_text("Fix the bug")
-    (scenario_dir / "skill-sets.yaml").write_text(
-        """
-sets:
-  - name: no-setup
-    skills: []
-  - name: with-setup
-    setup:
-      - npx @anthropic-ai/claude-code-skills add https://example.com/skill
-      - echo "ready"
-    skills: []
-"""
-    )
+    make_tree(scenario_dir, {
+        "scenario.md": "# Test",
+        "prompt.txt": "Fix the bug",
+        "skill-sets.yaml": _SKILL_SETS_SETUP,
+    })
 
     scenario = load_scenario(scenario_dir)
 
@@ -140,23 +162,16 @@ sets:
     ]
 
 
-def test_load_scenario_parses_multiline_extra_prompt(tmp_path: Path) -> None:
+def test_load_scenario_parses_multiline_extra_prompt(
+    tmp_path: Path, make_tree: Callable[[Path, dict[str, str | bytes]], None]
+) -> None:
     """Scenario loads multiline extra_prompt using YAML block scalar."""
     scenario_dir = tmp_path / "test-scenario"
-    scenario_dir.mkdir()
-    (scenario_dir / "scenario.md").write_text("# Test")
-    (scenario_dir / "prompt.txt").write_text("Debug this")
-    (scenario_dir / "skill-sets.yaml").write_text(
-        """
-sets:
-  - name: with-multiline
-    skills: []
-    extra_prompt: |
-      Before starting:
-      1. Check if any skill can help
-      2. Use the MCP server if available
-"""
-    )
+    make_tree(scenario_dir, {
+        "scenario.md": "# Test",
+        "prompt.txt": "Debug this",
+        "skill-sets.yaml": _SKILL_SETS_MULTILINE_PROMPT,
+    })
 
     scenario = load_scenario(scenario_dir)
 
@@ -1,10 +1,27 @@
 """Tests for skill_eval runner."""
 
+import io
 import json
+import os
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
-from skill_eval.runner import Runner
+import pytest
+
+import skill_eval.runner as runner_module
+from skill_eval.models import Scenario, SkillSet
+from skill_eval.runner import (
+    _COMPARE_CHUNK,
+    _PARALLEL_COMPARE_THRESHOLD,
+    RunResult,
+    RunTask,
+    Runner,
+    _find_changed_files,
+)
 
 
 def test_runner_creates_output_directory(tmp_path: Path) -> None:
@@ -21,18 +38,59 @@ def test_runner_creates_output_directory(tmp_path: Path) -> None:
     assert len(run_dir.name) == 17  # e.g., 2025-01-15-103045 (with seconds)
 
 
+@pytest.mark.parametrize("url_first", [True, False])
+def test_runner_shared_skill_folder_keeps_list_order(
+    tmp_path: Path,
+    eval_tree: Path,
+    make_tree: Callable[[Path, dict[str, str | bytes]], None],
+    urlopen_mock: Callable[[bytes], MagicMock],
+    url_first: bool,
+) -> None:
+    """A URL and a local skill sharing a folder overwrite it in list order."""
+    make_tree(tmp_path, {"skills/shared/SKILL.md": "# Local Skill"})
+    urlopen_mock(b"# Remote Skill")
+    skills = ["https://example.com/skills/shared/SKILL.md", "skills/shared/SKILL.md"]
+    if not url_first:
+        skills.reverse()
+
+    runner = Runner(evals_dir=eval_tree)
+    env_dir, _ = runner.prepare_environment(
+        scenario_dir=eval_tree / "scenarios" / "test", context_dir=None, skills=skills
+    )
+
+    expected = "# Local Skill" if url_first else "# Remote Skill"
+    assert (env_dir / ".claude" / "skills" / "shared" / "SKILL.md").read_text() == expected
+
+
+def test_runner_local_skills_only_skips_download_pool(
+    tmp_path: Path, eval_tree: Path, make_tree: Callable[[Path, dict[str, str | bytes]], None]
+) -> None:
+    """With no URL skills, no thread pool is started for downloads."""
+    make_tree(tmp_path, {"skills/local-skill/SKILL.md": "# Local Skill"})
+
+    runner = Runner(evals_dir=eval_tree)
+    with patch.object(runner_module, "ThreadPoolExecutor") as pool:
+        env_dir, _ = runner.prepare_environment(
+            scenario_dir=eval_tree / "scenarios" / "test",
+            context_dir=None,
+            skills=["skills/local-skill/SKILL.md"],
+        )
+
+    pool.assert_not_called()
+    assert (env_dir / ".claude" / "skills" / "local-skill" / "SKILL.md").exists()
+
+
 def test_runner_prepares_isolated_environment(tmp_path: Path) -> None:
     """Runner creates isolated Claude config with only specified skills."""
     evals_dir = tmp_path / "evals"
     evals_dir.mkdir()
 
     # Create scenario dir with skill reference
-    scenario_dir = evals_dir / "scenarios" / "test-scenario"
+    scenario_dir = tmp_path / "evals" / "scenarios" / "test-scenario"
     scenario_dir.mkdir(parents=True)
 
-    # Create skill in repo (evals_dir parent simulates repo_dir)
-    repo_dir = evals_dir.parent
-    skill_dir = repo_dir / "skills" / "debug"
+    # Create skill in repo (evals_dir parent, i.e. tmp_path, simulates repo_dir)
+    skill_dir = tmp_path / "skills" / "debug"
     skill_dir.mkdir(parents=True)
     (skill_dir / "SKILL.md").write_text("# Debug skill v1")
 
@@ -51,12 +109,10 @@ def test_runner_prepares_isolated_environment(tmp_path: Path) -> None:
     assert "Debug skill v1" in skill_file.read_text()
 
 
-def test_runner_creates_mcp_config(tmp_path: Path) -> None:
+def test_runner_creates_mcp_config(eval_tree: Path) -> None:
     """Runner creates mcp-servers.json when mcp_servers provided."""
-    evals_dir = tmp_path / "evals"
-    evals_dir.mkdir()
+    evals_dir = eval_tree
     scenario_dir = evals_dir / "scenarios" / "test"
-    scenario_dir.mkdir(parents=True)
 
     runner = Runner(evals_dir=evals_dir)
     mcp_servers = {
@@ -76,18 +132,34 @@ def test_runner_creates_mcp_config(tmp_path: Path) -> None:
     assert mcp_config_path is not None
     assert mcp_config_path.exists()
 
-    config = json.loads(mcp_config_path.read_text())
+    config = json.loads(mcp_config_path.read_bytes())
     assert "mcpServers" in config
     assert "dbt" in config["mcpServers"]
     assert config["mcpServers"]["dbt"]["command"] == "uvx"
 
 
-def test_runner_copies_env_file_with_mcp(tmp_path: Path) -> None:
+def test_runner_writes_credentials_owner_only(eval_tree: Path) -> None:
+    """Runner writes Claude credentials into the environment readable only by the owner."""
+    evals_dir = eval_tree
+    scenario_dir = evals_dir / "scenarios" / "test"
+
+    runner = Runner(evals_dir=evals_dir)
+    with patch.object(runner, "_get_claude_credentials", return_value='{"token": "abc"}'):
+        env_dir, _ = runner.prepare_environment(
+            scenario_dir=scenario_dir,
+            context_dir=None,
+            skills=[],
+        )
+
+    credentials_file = env_dir / ".claude" / ".credentials.json"
+    assert credentials_file.read_text() == '{"token": "abc"}'
+    assert credentials_file.stat().st_mode & 0o777 == 0o600
+
+
+def test_runner_copies_env_file_with_mcp(eval_tree: Path) -> None:
     """Runner copies .env file when mcp_servers are configured."""
-    evals_dir = tmp_path / "evals"
-    evals_dir.mkdir()
+    evals_dir = eval_tree
     scenario_dir = evals_dir / "scenarios" / "test"
-    scenario_dir.mkdir(parents=True)
     (scenario_dir / ".env").write_text("DBT_TOKEN=secret123")
 
     runner = Runner(evals_dir=evals_dir)
@@ -133,6 +205,48 @@ def test_parse_json_output_extracts_metadata(tmp_path: Path) -> None:
     assert "I found the issue." in result["output_text"]
 
 
+def test_parse_json_output_dedupes_skills_invoked(tmp_path: Path) -> None:
+    """NDJSON parser records each invoked skill once, in first-seen order."""
+    evals_dir = tmp_path / "evals"
+    evals_dir.mkdir()
+    runner = Runner(evals_dir=evals_dir)
+
+    ndjson = """{"type":"assistant","message":{"content":[{"type":"tool_use","name":"Skill","input":{"skill":"debug"}}]}}
+{"type":"assistant","message":{"content":[{"type":"tool_use","name":"Skill","input":{"skill":"testing"}}]}}
+{"type":"assistant","message":{"content":[{"type":"tool_use","name":"Skill","input":{"skill":"debug"}}]}}"""
+
+    result = runner._parse_json_output(ndjson)
+
+    assert result["skills_invoked"] == ["debug", "testing"]
+    assert result["tools_used"] == ["Skill"]
+
+
+def test_parse_json_output_skips_user_messages_undecoded(tmp_path: Path) -> None:
+    """NDJSON parser skips tool-result (user) lines without decoding them."""
+    runner = Runner(evals_dir=tmp_path / "evals")
+
+    ndjson = """{"type":"user","message":{"content":[{"type":"tool_result","content":"big file"}]}}
+{"type":"assistant","message":{"content":[{"type":"text","text":"Done"}]}}"""
+
+    with patch.object(runner_module, "_json_decode", wraps=runner_module._json_decode) as decode:
+        result = runner._parse_json_output(ndjson)
+
+    assert decode.call_count == 1
+    assert result["output_text"] == "Done"
+
+
+def test_parse_json_output_splits_only_on_newlines(tmp_path: Path) -> None:
+    """NDJSON parser keeps lines whole when text contains unescaped U+2028."""
+    runner = Runner(evals_dir=tmp_path / "evals")
+
+    # JSON.stringify leaves U+2028/U+2029 unescaped in stream-json output
+    ndjson = '{"type":"assistant","message":{"content":[{"type":"text","text":"one\u2028two"}]}}'
+
+    result = runner._parse_json_output(ndjson)
+
+    assert result["output_text"] == "one\u2028two"
+
+
 def test_parse_json_output_handles_empty_input(tmp_path: Path) -> None:
     """NDJSON parser handles empty input gracefully."""
     evals_dir = tmp_path / "evals"
@@ -151,12 +265,11 @@ def test_runner_prepares_environment_with_folder_path(tmp_path: Path) -> None:
     evals_dir = tmp_path / "evals"
     evals_dir.mkdir()
 
-    scenario_dir = evals_dir / "scenarios" / "test-scenario"
+    scenario_dir = tmp_path / "evals" / "scenarios" / "test-scenario"
     scenario_dir.mkdir(parents=True)
 
-    # Create skill folder with SKILL.md and supporting files
-    repo_dir = evals_dir.parent
-    skill_dir = repo_dir / "skills" / "fetch-docs"
+    # Create skill folder with SKILL.md and supporting files (in the repo dir)
+    skill_dir = tmp_path / "skills" / "fetch-docs"
     skill_dir.mkdir(parents=True)
     (skill_dir / "SKILL.md").write_text("# Fetch docs skill")
     (skill_dir / "helper.sh").write_text("#!/bin/bash\necho 'helper'")
@@ -179,6 +292,44 @@ def test_runner_prepares_environment_with_folder_path(tmp_path: Path) -> None:
     assert "helper" in (skill_dest / "helper.sh").read_text()
 
 
+def test_runner_folder_copy_keeps_file_modes(tmp_path: Path, eval_tree: Path) -> None:
+    """Copied skill folders keep file contents and permissions (e.g. executable scripts)."""
+    script = tmp_path / "skills" / "tools" / "scripts" / "run.sh"
+    script.parent.mkdir(parents=True)
+    script.write_text("#!/bin/sh\necho hi\n")
+    script.chmod(0o755)
+
+    runner = Runner(evals_dir=eval_tree)
+    env_dir, _ = runner.prepare_environment(
+        scenario_dir=eval_tree / "scenarios" / "test",
+        context_dir=None,
+        skills=["skills/tools"],
+    )
+
+    copied = env_dir / ".claude" / "skills" / "tools" / "scripts" / "run.sh"
+    assert copied.read_text() == "#!/bin/sh\necho hi\n"
+    assert copied.stat().st_mode & 0o777 == 0o755
+
+
+@pytest.mark.parametrize(
+    "copy_file_range",
+    [
+        pytest.param({"side_effect": OSError(18, "EXDEV")}, id="raises"),
+        pytest.param({"return_value": 0}, id="copies-nothing"),
+    ],
+)
+def test_copy_file_falls_back_to_copyfile(tmp_path: Path, copy_file_range: dict) -> None:
+    """_copy_file falls back to shutil.copyfile when copy_file_range fails or copies nothing."""
+    src = tmp_path / "src.md"
+    src.write_bytes(b"skill body")
+    dst = tmp_path / "dst.md"
+
+    with patch.object(runner_module.os, "copy_file_range", create=True, **copy_file_range):
+        runner_module._copy_file(src, dst)
+
+    assert dst.read_bytes() == b"skill body"
+
+
 def test_runner_is_url_detection(tmp_path: Path) -> None:
     """Runner correctly identifies HTTP(S) URLs."""
     evals_dir = tmp_path / "evals"
@@ -190,6 +341,7 @@ def test_runner_is_url_detection(tmp_path: Path) -> None:
     assert runner._is_url("http://example.com/skills/my-skill/SKILL.md")
     assert runner._is_url("https://raw.githubusercontent.com/org/repo/main/skills/SKILL.md")
     assert runner._is_url("https://github.com/org/repo/blob/main/skills/SKILL.md")
+    assert runner._is_url("HTTPS://example.com/skills/my-skill/SKILL.md")
 
     # Should NOT be detected as URLs
     assert not runner._is_url("skills/fetching-dbt-docs")
@@ -224,6 +376,11 @@ def test_runner_normalizes_github_blob_urls(tmp_path: Path) -> None:
     raw_url = "https://raw.githubusercontent.com/org/repo/abc123def456/skills/my-skill/SKILL.md"
     assert runner._normalize_github_url(blob_url) == raw_url
 
+    # Query string is dropped
+    blob_url = "https://github.com/org/repo/blob/main/skills/my-skill/SKILL.md?plain=1"
+    raw_url = "https://raw.githubusercontent.com/org/repo/main/skills/my-skill/SKILL.md"
+    assert runner._normalize_github_url(blob_url) == raw_url
+
     # Already raw URL should be unchanged
     raw_url = "https://raw.githubusercontent.com/org/repo/main/skills/SKILL.md"
     assert runner._normalize_github_url(raw_url) == raw_url
@@ -233,202 +390,111 @@ def test_runner_normalizes_github_blob_urls(tmp_path: Path) -> None:
     assert runner._normalize_github_url(other_url) == other_url
 
 
-def test_runner_downloads_skill_from_url(tmp_path: Path) -> None:
-    """Runner downloads skill from HTTP URL."""
-    evals_dir = tmp_path / "evals"
-    evals_dir.mkdir()
-    scenario_dir = evals_dir / "scenarios" / "test"
-    scenario_dir.mkdir(parents=True)
-
-    runner = Runner(evals_dir=evals_dir)
-
-    # Mock urllib.request.urlopen
-    skill_content = "# Downloaded Skill\n\nThis is a test skill."
-    mock_response = MagicMock()
-    mock_response.read.return_value = skill_content.encode("utf-8")
-    mock_response.__enter__ = MagicMock(return_value=mock_response)
-    mock_response.__exit__ = MagicMock(return_value=False)
-
-    with patch("skill_eval.runner.urllib.request.urlopen", return_value=mock_response) as mock_urlopen:
-        env_dir, _ = runner.prepare_environment(
-            scenario_dir=scenario_dir,
-            context_dir=None,
-            skills=["https://example.com/skills/my-skill/SKILL.md"],
-        )
-
-        # Verify urlopen was called with correct URL
-        mock_urlopen.assert_called_once_with(
+@pytest.mark.parametrize(
+    ("url", "download_url", "folder", "content"),
+    [
+        pytest.param(
             "https://example.com/skills/my-skill/SKILL.md",
-            timeout=30,
-        )
-
-        # Verify skill was saved correctly
-        skill_file = env_dir / ".claude" / "skills" / "my-skill" / "SKILL.md"
-        assert skill_file.exists()
-        assert "Downloaded Skill" in skill_file.read_text()
-
-
-def test_runner_downloads_skill_from_raw_github_url(tmp_path: Path) -> None:
-    """Runner downloads skill from raw GitHub URL."""
-    evals_dir = tmp_path / "evals"
-    evals_dir.mkdir()
-    scenario_dir = evals_dir / "scenarios" / "test"
-    scenario_dir.mkdir(parents=True)
-
-    runner = Runner(evals_dir=evals_dir)
-
-    skill_content = "# GitHub Skill"
-    mock_response = MagicMock()
-    mock_response.read.return_value = skill_content.encode("utf-8")
-    mock_response.__enter__ = MagicMock(return_value=mock_response)
-    mock_response.__exit__ = MagicMock(return_value=False)
-
-    with patch("skill_eval.runner.urllib.request.urlopen", return_value=mock_response) as mock_urlopen:
-        env_dir, _ = runner.prepare_environment(
-            scenario_dir=scenario_dir,
-            context_dir=None,
-            skills=["https://raw.githubusercontent.com/org/repo/main/skills/github-skill/SKILL.md"],
-        )
-
-        mock_urlopen.assert_called_once_with(
+            "https://example.com/skills/my-skill/SKILL.md",
+            "my-skill",
+            "# Downloaded Skill\n\nThis is a test skill.",
+            id="url",
+        ),
+        pytest.param(
+            # Skill name extracted from parent folder in URL path
             "https://raw.githubusercontent.com/org/repo/main/skills/github-skill/SKILL.md",
-            timeout=30,
-        )
-
-        # Skill name extracted from parent folder in URL path
-        skill_file = env_dir / ".claude" / "skills" / "github-skill" / "SKILL.md"
-        assert skill_file.exists()
-        assert "GitHub Skill" in skill_file.read_text()
-
-
-def test_runner_downloads_skill_from_github_blob_url(tmp_path: Path) -> None:
-    """Runner converts GitHub blob URL to raw and downloads."""
-    evals_dir = tmp_path / "evals"
-    evals_dir.mkdir()
-    scenario_dir = evals_dir / "scenarios" / "test"
-    scenario_dir.mkdir(parents=True)
-
-    runner = Runner(evals_dir=evals_dir)
-
-    skill_content = "# Blob Skill"
-    mock_response = MagicMock()
-    mock_response.read.return_value = skill_content.encode("utf-8")
-    mock_response.__enter__ = MagicMock(return_value=mock_response)
-    mock_response.__exit__ = MagicMock(return_value=False)
-
-    with patch("skill_eval.runner.urllib.request.urlopen", return_value=mock_response) as mock_urlopen:
-        env_dir, _ = runner.prepare_environment(
-            scenario_dir=scenario_dir,
-            context_dir=None,
-            # GitHub blob URL (not raw)
-            skills=["https://github.com/org/repo/blob/main/skills/blob-skill/SKILL.md"],
-        )
-
-        # Should be converted to raw URL
-        mock_urlopen.assert_called_once_with(
+            "https://raw.githubusercontent.com/org/repo/main/skills/github-skill/SKILL.md",
+            "github-skill",
+            "# GitHub Skill",
+            id="raw-github",
+        ),
+        pytest.param(
+            # GitHub blob URL (not raw) is converted to a raw URL
+            "https://github.com/org/repo/blob/main/skills/blob-skill/SKILL.md",
             "https://raw.githubusercontent.com/org/repo/main/skills/blob-skill/SKILL.md",
-            timeout=30,
-        )
-
-        skill_file = env_dir / ".claude" / "skills" / "blob-skill" / "SKILL.md"
-        assert skill_file.exists()
-        assert "Blob Skill" in skill_file.read_text()
-
-
-def test_runner_downloads_root_level_skill_uses_hostname(tmp_path: Path) -> None:
-    """Runner uses hostname as folder name for root-level skills."""
-    evals_dir = tmp_path / "evals"
-    evals_dir.mkdir()
-    scenario_dir = evals_dir / "scenarios" / "test"
-    scenario_dir.mkdir(parents=True)
-
-    runner = Runner(evals_dir=evals_dir)
-
-    skill_content = "# Root Skill"
-    mock_response = MagicMock()
-    mock_response.read.return_value = skill_content.encode("utf-8")
-    mock_response.__enter__ = MagicMock(return_value=mock_response)
-    mock_response.__exit__ = MagicMock(return_value=False)
-
-    with patch("skill_eval.runner.urllib.request.urlopen", return_value=mock_response):
-        env_dir, _ = runner.prepare_environment(
-            scenario_dir=scenario_dir,
-            context_dir=None,
-            skills=["https://example.com/SKILL.md"],
-        )
-
-        # Uses hostname (dots replaced with dashes) as folder name
-        skill_file = env_dir / ".claude" / "skills" / "example-com" / "SKILL.md"
-        assert skill_file.exists()
-
-
-def test_runner_downloads_github_root_skill_uses_repo_name(tmp_path: Path) -> None:
-    """Runner uses repo name for GitHub root-level skills."""
-    evals_dir = tmp_path / "evals"
-    evals_dir.mkdir()
+            "blob-skill",
+            "# Blob Skill",
+            id="github-blob",
+        ),
+        pytest.param(
+            # Root-level skill: hostname (dots replaced with dashes) as folder name
+            "https://example.com/SKILL.md",
+            "https://example.com/SKILL.md",
+            "example-com",
+            "# Root Skill",
+            id="root-uses-hostname",
+        ),
+        pytest.param(
+            # GitHub blob URL at repo root: repo name as folder name
+            "https://github.com/myorg/my-repo/blob/main/SKILL.md",
+            "https://raw.githubusercontent.com/myorg/my-repo/main/SKILL.md",
+            "my-repo",
+            "# GitHub Root Skill",
+            id="github-root-uses-repo-name",
+        ),
+    ],
+)
+def test_runner_downloads_skill(
+    eval_tree: Path,
+    urlopen_mock: Callable[[bytes], MagicMock],
+    url: str,
+    download_url: str,
+    folder: str,
+    content: str,
+) -> None:
+    """Runner downloads a skill from an HTTP URL into a folder named from the URL."""
+    evals_dir = eval_tree
     scenario_dir = evals_dir / "scenarios" / "test"
-    scenario_dir.mkdir(parents=True)
 
     runner = Runner(evals_dir=evals_dir)
+    mock_urlopen = urlopen_mock(content.encode("utf-8"))
 
-    skill_content = "# GitHub Root Skill"
-    mock_response = MagicMock()
-    mock_response.read.return_value = skill_content.encode("utf-8")
-    mock_response.__enter__ = MagicMock(return_value=mock_response)
-    mock_response.__exit__ = MagicMock(return_value=False)
+    env_dir, _ = runner.prepare_environment(
+        scenario_dir=scenario_dir,
+        context_dir=None,
+        skills=[url],
+    )
 
-    with patch("skill_eval.runner.urllib.request.urlopen", return_value=mock_response):
-        env_dir, _ = runner.prepare_environment(
-            scenario_dir=scenario_dir,
-            context_dir=None,
-            # GitHub blob URL at repo root
-            skills=["https://github.com/myorg/my-repo/blob/main/SKILL.md"],
-        )
+    mock_urlopen.assert_called_once_with(download_url, timeout=30)
 
-        # Uses repo name as folder
-        skill_file = env_dir / ".claude" / "skills" / "my-repo" / "SKILL.md"
-        assert skill_file.exists()
+    skill_file = env_dir / ".claude" / "skills" / folder / "SKILL.md"
+    assert skill_file.read_text() == content
 
 
-def test_runner_mixes_local_and_url_skills(tmp_path: Path) -> None:
+def test_runner_mixes_local_and_url_skills(
+    tmp_path: Path, eval_tree: Path, urlopen_mock: Callable[[bytes], MagicMock]
+) -> None:
     """Runner handles mix of local and URL skills."""
-    evals_dir = tmp_path / "evals"
-    evals_dir.mkdir()
+    evals_dir = eval_tree
     scenario_dir = evals_dir / "scenarios" / "test"
-    scenario_dir.mkdir(parents=True)
 
-    # Create local skill
-    repo_dir = evals_dir.parent
-    local_skill_dir = repo_dir / "skills" / "local-skill"
+    # Create local skill (in the repo dir)
+    local_skill_dir = tmp_path / "skills" / "local-skill"
     local_skill_dir.mkdir(parents=True)
     (local_skill_dir / "SKILL.md").write_text("# Local Skill")
 
     runner = Runner(evals_dir=evals_dir)
 
     # Mock for URL skill
-    mock_response = MagicMock()
-    mock_response.read.return_value = b"# Remote Skill"
-    mock_response.__enter__ = MagicMock(return_value=mock_response)
-    mock_response.__exit__ = MagicMock(return_value=False)
+    urlopen_mock(b"# Remote Skill")
 
-    with patch("skill_eval.runner.urllib.request.urlopen", return_value=mock_response):
-        env_dir, _ = runner.prepare_environment(
-            scenario_dir=scenario_dir,
-            context_dir=None,
-            skills=[
-                "skills/local-skill/SKILL.md",  # Local
-                "https://example.com/skills/remote-skill/SKILL.md",  # URL
-            ],
-        )
+    env_dir, _ = runner.prepare_environment(
+        scenario_dir=scenario_dir,
+        context_dir=None,
+        skills=[
+            "skills/local-skill/SKILL.md",  # Local
+            "https://example.com/skills/remote-skill/SKILL.md",  # URL
+        ],
+    )
 
-        # Both skills should be present
-        local_file = env_dir / ".claude" / "skills" / "local-skill" / "SKILL.md"
-        remote_file = env_dir / ".claude" / "skills" / "remote-skill" / "SKILL.md"
+    # Both skills should be present
+    local_file = env_dir / ".claude" / "skills" / "local-skill" / "SKILL.md"
+    remote_file = env_dir / ".claude" / "skills" / "remote-skill" / "SKILL.md"
 
-        assert local_file.exists()
-        assert "Local Skill" in local_file.read_text()
-        assert remote_file.exists()
-        assert "Remote Skill" in remote_file.read_text()
+    assert local_file.exists()
+    assert "Local Skill" in local_file.read_text()
+    assert remote_file.exists()
+    assert "Remote Skill" in remote_file.read_text()
 
 
 def test_generate_transcript_replaces_titles(tmp_path: Path) -> None:
@@ -525,9 +591,6 @@ def test_generate_transcript_handles_empty_projects_dir(tmp_path: Path) -> None:
 
 def test_run_parallel_executes_all_tasks(tmp_path: Path) -> None:
     """Parallel runner executes all tasks and returns results."""
-    from skill_eval.models import Scenario, SkillSet
-    from skill_eval.runner import RunTask
-
     evals_dir = tmp_path / "evals"
     evals_dir.mkdir()
     (evals_dir / "runs").mkdir()
@@ -560,7 +623,6 @@ def test_run_parallel_executes_all_tasks(tmp_path: Path) -> None:
 
     # Mock run_scenario to return success
     def mock_run_scenario(scenario, skill_set, run_dir):
-        from skill_eval.runner import RunResult
         return RunResult(
             scenario_name=scenario.name,
             skill_set_name=skill_set.name,
@@ -584,9 +646,6 @@ def test_run_parallel_executes_all_tasks(tmp_path: Path) -> None:
 
 def test_run_parallel_calls_progress_callback(tmp_path: Path) -> None:
     """Parallel runner calls progress callback for each completed task."""
-    from skill_eval.models import Scenario, SkillSet
-    from skill_eval.runner import RunTask
-
     evals_dir = tmp_path / "evals"
     evals_dir.mkdir()
     (evals_dir / "runs").mkdir()
@@ -612,7 +671,6 @@ def test_run_parallel_calls_progress_callback(tmp_path: Path) -> None:
         callback_calls.append((task.skill_set.name, result.success))
 
     def mock_run_scenario(scenario, skill_set, run_dir):
-        from skill_eval.runner import RunResult
         return RunResult(
             scenario_name=scenario.name,
             skill_set_name=skill_set.name,
@@ -629,9 +687,6 @@ def test_run_parallel_calls_progress_callback(tmp_path: Path) -> None:
 
 def test_run_parallel_handles_task_failure(tmp_path: Path) -> None:
     """Parallel runner continues after task failure and captures error."""
-    from skill_eval.models import Scenario, SkillSet
-    from skill_eval.runner import RunTask
-
     evals_dir = tmp_path / "evals"
     evals_dir.mkdir()
     (evals_dir / "runs").mkdir()
@@ -652,7 +707,6 @@ def test_run_parallel_handles_task_failure(tmp_path: Path) -> None:
     ]
 
     def mock_run_scenario(scenario, skill_set, run_dir):
-        from skill_eval.runner import RunResult
         if skill_set.name == "failure":
             raise RuntimeError("Simulated failure")
         return RunResult(
@@ -678,11 +732,6 @@ def test_run_parallel_handles_task_failure(tmp_path: Path) -> None:
 
 def test_run_parallel_respects_max_workers(tmp_path: Path) -> None:
     """Parallel runner respects max_workers limit."""
-    import threading
-    import time
-    from skill_eval.models import Scenario, SkillSet
-    from skill_eval.runner import RunTask
-
     evals_dir = tmp_path / "evals"
     evals_dir.mkdir()
     (evals_dir / "runs").mkdir()
@@ -708,7 +757,6 @@ def test_run_parallel_respects_max_workers(tmp_path: Path) -> None:
 
     def mock_run_scenario(scenario, skill_set, run_dir):
         nonlocal max_concurrent, current_concurrent
-        from skill_eval.runner import RunResult
 
         with lock:
             current_concurrent += 1
@@ -733,10 +781,35 @@ def test_run_parallel_respects_max_workers(tmp_path: Path) -> None:
     assert max_concurrent <= 2
 
 
+class _PidRunner(Runner):
+    """Runner whose scenarios just report the worker's process id (picklable)."""
+    def run_scenario(self, scenario, skill_set, run_dir):
+        return RunResult(
+            scenario_name=scenario.name,
+            skill_set_name=skill_set.name,
+            output=str(os.getpid()),
+            success=True,
+        )
+
+
+def test_run_parallel_accepts_process_pool(tmp_path: Path) -> None:
+    """Parallel runner can run tasks in worker processes."""
+    runner = _PidRunner(evals_dir=tmp_path / "evals")
+    scenario = Scenario(name="test", path=tmp_path / "scenarios" / "test", prompt="Test", skill_sets=[])
+    tasks = [
+        RunTask(scenario=scenario, skill_set=SkillSet(name=f"set-{i}", skills=[]), run_dir=tmp_path)
+        for i in range(2)
+    ]
+
+    results = runner.run_parallel(tasks, max_workers=2, executor_cls=ProcessPoolExecutor)
+
+    assert {r.skill_set_name for r in results} == {"set-0", "set-1"}
+    assert all(r.success for r in results)
+    assert str(os.getpid()) not in {r.output for r in results}
+
+
 def test_find_changed_files_detects_modified_files(tmp_path: Path) -> None:
     """_find_changed_files detects files with different content."""
-    from skill_eval.runner import _find_changed_files
-
     original = tmp_path / "original"
     modified = tmp_path / "modified"
     original.mkdir()
@@ -756,10 +829,46 @@ def test_find_changed_files_detects_modified_files(tmp_path: Path) -> None:
     assert Path("changed.txt") in changed
 
 
+def test_find_changed_files_compares_contents_past_first_chunk(tmp_path: Path) -> None:
+    """_find_changed_files compares equal-sized files in full, regardless of mtime."""
+    original = tmp_path / "original"
+    modified = tmp_path / "modified"
+    original.mkdir()
+    modified.mkdir()
+
+    prefix = b"x" * _COMPARE_CHUNK
+    (original / "changed.bin").write_bytes(prefix + b"a")
+    (modified / "changed.bin").write_bytes(prefix + b"b")
+    (original / "touched.bin").write_bytes(prefix + b"a")
+    (modified / "touched.bin").write_bytes(prefix + b"a")
+    os.utime(modified / "touched.bin", ns=(0, 0))
+
+    changed = _find_changed_files(original, modified, set())
+
+    assert changed == [Path("changed.bin")]
+
+
+def test_find_changed_files_compares_large_trees_in_parallel(tmp_path: Path) -> None:
+    """_find_changed_files gives the same answer when comparing in a thread pool."""
+    original = tmp_path / "original"
+    modified = tmp_path / "modified"
+    original.mkdir()
+    modified.mkdir()
+
+    count = _PARALLEL_COMPARE_THRESHOLD + 10
+    for i in range(count):
+        (original / f"file{i}.txt").write_text(f"content {i}")
+        (modified / f"file{i}.txt").write_text(f"content {i}" if i % 10 else f"changed {i}")
+
+    with patch("skill_eval.runner.ThreadPoolExecutor", wraps=ThreadPoolExecutor) as executor:
+        changed = _find_changed_files(original, modified, set())
+
+    executor.assert_called_once()
+    assert sorted(changed) == sorted(Path(f"file{i}.txt") for i in range(0, count, 10))
+
+
 def test_find_changed_files_detects_new_files(tmp_path: Path) -> None:
     """_find_changed_files detects files only in modified directory."""
-    from skill_eval.runner import _find_changed_files
-
     original = tmp_path / "original"
     modified = tmp_path / "modified"
     original.mkdir()
@@ -777,8 +886,6 @@ def test_find_changed_files_detects_new_files(tmp_path: Path) -> None:
 
 def test_find_changed_files_detects_new_directories(tmp_path: Path) -> None:
     """_find_changed_files detects all files in new directories."""
-    from skill_eval.runner import _find_changed_files
-
     original = tmp_path / "original"
     modified = tmp_path / "modified"
     original.mkdir()
@@ -799,8 +906,6 @@ def test_find_changed_files_detects_new_directories(tmp_path: Path) -> None:
 
 def test_find_changed_files_respects_exclusions(tmp_path: Path) -> None:
     """_find_changed_files excludes specified names."""
-    from skill_eval.runner import _find_changed_files
-
     original = tmp_path / "original"
     modified = tmp_path / "modified"
     original.mkdir()
@@ -823,10 +928,22 @@ def test_find_changed_files_respects_exclusions(tmp_path: Path) -> None:
     assert Path("included.txt") in changed
 
 
+def test_find_changed_files_excludes_names_inside_new_directories(tmp_path: Path) -> None:
+    """_find_changed_files skips excluded names at any depth of a new directory."""
+    original = tmp_path / "original"
+    modified = tmp_path / "modified"
+    original.mkdir()
+    (modified / "new_dir" / ".cache").mkdir(parents=True)
+    (modified / "new_dir" / ".cache" / "data.txt").write_text("cached")
+    (modified / "new_dir" / "kept.txt").write_text("keep me")
+
+    changed = _find_changed_files(original, modified, {".cache"})
+
+    assert changed == [Path("new_dir/kept.txt")]
+
+
 def test_find_changed_files_recurses_subdirectories(tmp_path: Path) -> None:
     """_find_changed_files finds changes in nested subdirectories."""
-    from skill_eval.runner import _find_changed_files
-
     original = tmp_path / "original"
     modified = tmp_path / "modified"
     original.mkdir()
@@ -856,8 +973,6 @@ def test_find_changed_files_recurses_subdirectories(tmp_path: Path) -> None:
 
 def test_find_changed_files_handles_missing_original(tmp_path: Path) -> None:
     """_find_changed_files treats all files as new when original doesn't exist."""
-    from skill_eval.runner import _find_changed_files
-
     modified = tmp_path / "modified"
     modified.mkdir()
 
@@ -875,8 +990,6 @@ def test_find_changed_files_handles_missing_original(tmp_path: Path) -> None:
 
 def test_find_changed_files_handles_none_original(tmp_path: Path) -> None:
     """_find_changed_files treats all files as new when original is None."""
-    from skill_eval.runner import _find_changed_files
-
     modified = tmp_path / "modified"
     modified.mkdir()
     (modified / "file.txt").write_text("content")
@@ -889,8 +1002,6 @@ def test_find_changed_files_handles_none_original(tmp_path: Path) -> None:
 
 def test_run_scenario_appends_extra_prompt(tmp_path: Path) -> None:
     """run_scenario appends skill_set.extra_prompt to base prompt."""
-    from skill_eval.models import Scenario, SkillSet
-
     evals_dir = tmp_path / "evals"
     evals_dir.mkdir()
     (evals_dir / "runs").mkdir()
@@ -927,10 +1038,41 @@ def test_run_scenario_appends_extra_prompt(tmp_path: Path) -> None:
     assert captured_prompt == "Fix the bug\n\nCheck if any skill can help."
 
 
+def test_run_scenario_copies_changed_files(tmp_path: Path) -> None:
+    """run_scenario copies new and modified files, keeping their directories."""
+    evals_dir = tmp_path / "evals"
+    evals_dir.mkdir()
+    context_models = tmp_path / "scenarios" / "test" / "context" / "models"
+    context_models.mkdir(parents=True)
+    (context_models / "a.sql").write_text("SELECT 1")
+
+    scenario = Scenario(
+        name="test-scenario",
+        path=tmp_path / "scenarios" / "test",
+        prompt="Fix the bug",
+        skill_sets=[],
+    )
+    runner = Runner(evals_dir=evals_dir)
+    run_dir = runner.create_run_dir()
+
+    def mock_run_claude(env_dir, prompt, mcp_config_path, allowed_tools, ctx_logger=None, extra_env=None):
+        (env_dir / "models" / "a.sql").write_text("SELECT 2")
+        (env_dir / "models" / "b.sql").write_text("SELECT 3")
+        (env_dir / "models" / "staging").mkdir()
+        (env_dir / "models" / "staging" / "c.sql").write_text("SELECT 4")
+        return {"output_text": "Done"}, True, None, ""
+
+    with patch.object(runner, "run_claude", side_effect=mock_run_claude):
+        runner.run_scenario(scenario, SkillSet(name="baseline", skills=[]), run_dir)
+
+    changes = run_dir / "test-scenario" / "baseline" / "changes" / "models"
+    assert (changes / "a.sql").read_text() == "SELECT 2"
+    assert (changes / "b.sql").read_text() == "SELECT 3"
+    assert (changes / "staging" / "c.sql").read_text() == "SELECT 4"
+
+
 def test_run_scenario_no_extra_prompt_unchanged(tmp_path: Path) -> None:
     """run_scenario uses base prompt unchanged when extra_prompt is empty."""
-    from skill_eval.models import Scenario, SkillSet
-
     evals_dir = tmp_path / "evals"
     evals_dir.mkdir()
     (evals_dir / "runs").mkdir()
@@ -969,13 +1111,9 @@ def test_run_scenario_no_extra_prompt_unchanged(tmp_path: Path) -> None:
 
 # Tests for run_claude timeout and stall detection
 
-import skill_eval.runner as runner_module
-
 
 def test_run_claude_normal_completion(tmp_path: Path) -> None:
     """run_claude returns successfully when process completes normally."""
-    import io
-
     evals_dir = tmp_path / "evals"
     evals_dir.mkdir()
     env_dir = tmp_path / "env"
@@ -1001,10 +1139,92 @@ def test_run_claude_normal_completion(tmp_path: Path) -> None:
     assert error is None
 
 
+def test_run_claude_parses_streamed_and_drained_output(tmp_path: Path) -> None:
+    """run_claude parses lines read while running and output drained after exit."""
+    evals_dir = tmp_path / "evals"
+    evals_dir.mkdir()
+    env_dir = tmp_path / "env"
+    (env_dir / ".claude").mkdir(parents=True)
+
+    runner = Runner(evals_dir=evals_dir)
+
+    mock_proc = MagicMock()
+    mock_proc.poll.side_effect = [None, 0]  # One read, then done
+    mock_proc.returncode = 0
+    mock_proc.stdout = io.StringIO(
+        '{"type":"assistant","message":{"content":[{"type":"text","text":"First"}]}}\n'
+        '{"type":"assistant","message":{"content":[{"type":"text","text":"Second"}]}}\n'
+        '{"type":"result","num_turns":2}\n'
+    )
+    mock_proc.stderr = io.StringIO("")
+
+    with patch.object(runner_module.subprocess, "Popen", return_value=mock_proc):
+        with patch.object(runner_module.select, "select", return_value=([mock_proc.stdout], [], [])):
+            parsed, success, error, raw = runner.run_claude(
+                env_dir, "test prompt", timeout=10, stall_timeout=5
+            )
+
+    assert success is True
+    assert parsed["output_text"] == "First\n\nSecond"
+    assert parsed["num_turns"] == 2
+    assert raw.count("\n") == 3
+
+
+def test_run_claude_drained_output_splits_only_on_newlines(tmp_path: Path) -> None:
+    """run_claude keeps drained lines whole when text contains unescaped U+2028."""
+    env_dir = tmp_path / "env"
+    (env_dir / ".claude").mkdir(parents=True)
+    runner = Runner(evals_dir=tmp_path / "evals")
+
+    mock_proc = MagicMock()
+    mock_proc.poll.return_value = 0  # Exits before any line is streamed
+    mock_proc.returncode = 0
+    mock_proc.stdout = io.StringIO(
+        '{"type":"assistant","message":{"content":[{"type":"text","text":"one\u2028two"}]}}\n'
+    )
+    mock_proc.stderr = io.StringIO("")
+
+    with patch.object(runner_module.subprocess, "Popen", return_value=mock_proc):
+        parsed, success, error, raw = runner.run_claude(
+            env_dir, "test prompt", timeout=10, stall_timeout=5
+        )
+
+    assert success is True
+    assert parsed["output_text"] == "one\u2028two"
+
+
+def test_run_claude_decodes_each_line_once(tmp_path: Path) -> None:
+    """run_claude logs progress from the message it already parsed for the result."""
+    env_dir = tmp_path / "env"
+    (env_dir / ".claude").mkdir(parents=True)
+    runner = Runner(evals_dir=tmp_path / "evals")
+
+    mock_proc = MagicMock()
+    mock_proc.poll.side_effect = [None, None, 0]
+    mock_proc.returncode = 0
+    mock_proc.stdout = io.StringIO(
+        '{"type":"assistant","message":{"content":[{"type":"tool_use","name":"Read","input":{}}]}}\n'
+        '{"type":"result","num_turns":1}\n'
+    )
+    mock_proc.stderr = io.StringIO("")
+    log = MagicMock()
+
+    with (
+        patch.object(runner_module.subprocess, "Popen", return_value=mock_proc),
+        patch.object(runner_module.select, "select", return_value=([mock_proc.stdout], [], [])),
+        patch.object(runner_module, "_json_decode", wraps=runner_module._json_decode) as decode,
+    ):
+        parsed, success, _, _ = runner.run_claude(
+            env_dir, "test prompt", timeout=10, stall_timeout=5, ctx_logger=log
+        )
+
+    assert decode.call_count == 2
+    assert parsed["tools_used"] == ["Read"]
+    assert "tool: Read" in log.debug.call_args.args[0]
+
+
 def test_run_claude_total_timeout(tmp_path: Path) -> None:
     """run_claude returns error when total timeout is exceeded."""
-    import io
-
     evals_dir = tmp_path / "evals"
     evals_dir.mkdir()
     env_dir = tmp_path / "env"
@@ -1045,8 +1265,6 @@ def test_run_claude_total_timeout(tmp_path: Path) -> None:
 
 def test_run_claude_stall_timeout(tmp_path: Path) -> None:
     """run_claude returns error when no output for stall_timeout seconds."""
-    import io
-
     evals_dir = tmp_path / "evals"
     evals_dir.mkdir()
     env_dir = tmp_path / "env"
@@ -1076,12 +1294,10 @@ def test_run_claude_stall_timeout(tmp_path: Path) -> None:
     mock_proc.kill.assert_called_once()
 
 
-def test_runner_copies_env_file_always(tmp_path: Path) -> None:
+def test_runner_copies_env_file_always(eval_tree: Path) -> None:
     """Runner copies .env file even without MCP servers."""
-    evals_dir = tmp_path / "evals"
-    evals_dir.mkdir()
+    evals_dir = eval_tree
     scenario_dir = evals_dir / "scenarios" / "test"
-    scenario_dir.mkdir(parents=True)
     (scenario_dir / ".env").write_text("DO_NOT_TRACK=1")
 
     runner = Runner(evals_dir=evals_dir)
@@ -1127,8 +1343,6 @@ def test_load_dot_env_parses_values(tmp_path: Path) -> None:
 
 def test_setup_commands_run_in_env_dir(tmp_path: Path) -> None:
     """Setup commands run in env_dir with .env vars."""
-    from skill_eval.models import Scenario, SkillSet
-
     evals_dir = tmp_path / "evals"
     evals_dir.mkdir()
     (evals_dir / "runs").mkdir()
@@ -1168,8 +1382,6 @@ def test_setup_commands_run_in_env_dir(tmp_path: Path) -> None:
 
 def test_setup_command_failure_stops_run(tmp_path: Path) -> None:
     """A failing setup command stops the run and returns failure."""
-    from skill_eval.models import Scenario, SkillSet
-
     evals_dir = tmp_path / "evals"
     evals_dir.mkdir()
     (evals_dir / "runs").mkdir()
@@ -1219,7 +1431,6 @@ def test_run_claude_receives_extra_env(tmp_path: Path) -> None:
         mock_proc = MagicMock()
         mock_proc.poll.return_value = 0
         mock_proc.returncode = 0
-        import io
         mock_proc.stdout = io.StringIO("")
         mock_proc.stderr = io.StringIO("")
         return mock_proc
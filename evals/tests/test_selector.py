@@ -1,18 +1,16 @@
 """Tests for skill_eval selector module."""
 
 from pathlib import Path
-from unittest.mock import patch
-
-import yaml
 
 from skill_eval.selector import (
     RunInfo,
     ScenarioInfo,
-    is_interactive,
     select_run,
     select_scenarios,
 )
 
+_TWO_SETS_YAML = "sets:\n- name: a\n- name: b\n"
+
 
 class TestRunInfo:
     """Tests for RunInfo dataclass."""
@@ -93,8 +91,7 @@ class TestScenarioInfo:
         scenario_dir = tmp_path / "my-scenario"
         scenario_dir.mkdir()
 
-        skill_sets = {"sets": [{"name": "a"}, {"name": "b"}]}
-        (scenario_dir / "skill-sets.yaml").write_text(yaml.dump(skill_sets))
+        (scenario_dir / "skill-sets.yaml").write_text(_TWO_SETS_YAML)
 
         info = ScenarioInfo.from_path(scenario_dir)
 
@@ -107,7 +104,7 @@ class TestScenarioInfo:
         """ScenarioInfo extracts description from scenario.md."""
         scenario_dir = tmp_path / "my-scenario"
         scenario_dir.mkdir()
-        (scenario_dir / "skill-sets.yaml").write_text(yaml.dump({"sets": []}))
+        (scenario_dir / "skill-sets.yaml").write_text("sets: []\n")
         (scenario_dir / "scenario.md").write_text("# Title\n\nThis is the description.")
 
         info = ScenarioInfo.from_path(scenario_dir)
@@ -118,7 +115,7 @@ class TestScenarioInfo:
         """ScenarioInfo truncates long descriptions."""
         scenario_dir = tmp_path / "my-scenario"
         scenario_dir.mkdir()
-        (scenario_dir / "skill-sets.yaml").write_text(yaml.dump({"sets": []}))
+        (scenario_dir / "skill-sets.yaml").write_text("sets: []\n")
 
         long_desc = "A" * 100
         (scenario_dir / "scenario.md").write_text(long_desc)
@@ -143,9 +140,7 @@ class TestScenarioInfo:
         """display_text shows all available information."""
         scenario_dir = tmp_path / "my-scenario"
         scenario_dir.mkdir()
-        (scenario_dir / "skill-sets.yaml").write_text(
-            yaml.dump({"sets": [{"name": "a"}, {"name": "b"}]})
-        )
+        (scenario_dir / "skill-sets.yaml").write_text(_TWO_SETS_YAML)
         (scenario_dir / "scenario.md").write_text("Test description")
 
         info = ScenarioInfo.from_path(scenario_dir)
@@ -156,22 +151,6 @@ class TestScenarioInfo:
         assert "Test description" in display
 
 
-class TestIsInteractive:
-    """Tests for is_interactive function."""
-
-    def test_returns_true_when_tty(self) -> None:
-        """is_interactive returns True when stdin is a TTY."""
-        with patch("skill_eval.selector.sys.stdin") as mock_stdin:
-            mock_stdin.isatty.return_value = True
-            assert is_interactive() is True
-
-    def test_returns_false_when_not_tty(self) -> None:
-        """is_interactive returns False when stdin is not a TTY."""
-        with patch("skill_eval.selector.sys.stdin") as mock_stdin:
-            mock_stdin.isatty.return_value = False
-            assert is_interactive() is False
-
-
 class TestSelectRun:
     """Tests for select_run function."""
 
@@ -10,13 +10,18 @@ Checks:
 Usage:
     python scripts/validate_repo.py
     python scripts/validate_repo.py --base-branch origin/main
+    python scripts/validate_repo.py --use-worktree  # uncommitted version bumps
 """
 
 import argparse
+import functools
 import json
+import os
 import re
 import subprocess
 import sys
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 REPO_ROOT = Path(__file__).resolve().parent.parent
@@ -24,8 +29,37 @@ TILE_JSON = REPO_ROOT / "tile.json"
 MARKETPLACE_JSON = REPO_ROOT / ".claude-plugin" / "marketplace.json"
 SKILLS_DIR = REPO_ROOT / "skills"
 
-# Matches [text](path) and [text](path#heading)
-MARKDOWN_LINK_RE = re.compile(r"\[(?:[^\]]*)\]\(([^)]+)\)")
+# Matches [text](path) and [text](path#heading). Each character class
+# excludes the delimiter that follows it, so the possessive quantifiers never
+# change what matches; they just stop the engine from backtracking through
+# long unclosed "[" or "(" runs
+MARKDOWN_LINK_RE = re.compile(r"\[[^\]]*+\]\(([^)]++)\)")
+# Same links, capturing only the path (anchor fragment excluded); links with
+# no path part, like [text](#heading), don't match
+LINK_TARGET_RE = re.compile(r"\[[^\]]*+\]\(([^)#]++)(?:#[^)]*+)?\)")
+
+
+def walk_files(root: Path | str, skip_hidden: bool = False) -> Iterator[str]:
+    """Yield the path of every file under root, recursively, as a str.
+
+    Uses os.scandir so each entry's type comes from the directory read rather
+    than a stat per entry. Symlinked directories are not followed; with
+    skip_hidden, neither are directories whose name starts with ".".
+    """
+    stack = [os.fspath(root)]
+    while stack:
+        with os.scandir(stack.pop()) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    if not (skip_hidden and entry.name.startswith(".")):
+                        stack.append(entry.path)
+                elif entry.is_file():
+                    yield entry.path
+
+
+def _path_sort_key(path: str) -> list[str]:
+    """Sort key ordering str paths component-wise, as sorting Paths would."""
+    return path.split(os.sep)
 
 
 def find_all_skills() -> dict[str, Path]:
@@ -34,9 +68,14 @@ def find_all_skills() -> dict[str, Path]:
     Returns dict of skill_name -> skill_dir_path.
     """
     skills = {}
-    for skill_md in sorted(SKILLS_DIR.rglob("SKILL.md")):
-        skill_dir = skill_md.parent
-        skills[skill_dir.name] = skill_dir
+    # Hidden dirs (.claude-plugin, ...) hold plugin metadata, never skills
+    skill_mds = [
+        f for f in walk_files(SKILLS_DIR, skip_hidden=True)
+        if os.path.basename(f) == "SKILL.md"
+    ]
+    for skill_md in sorted(skill_mds, key=_path_sort_key):
+        skill_dir = os.path.dirname(skill_md)
+        skills[os.path.basename(skill_dir)] = Path(skill_dir)
     return skills
 
 
@@ -64,7 +103,7 @@ def check_tile_json(skills: dict[str, Path]) -> list[str]:
     if not TILE_JSON.exists():
         return ["tile.json not found at repo root"]
 
-    tile = json.loads(TILE_JSON.read_text())
+    tile = json.loads(TILE_JSON.read_bytes())
     tile_skills = tile.get("skills", {})
 
     listed = set(tile_skills.keys())
@@ -100,7 +139,7 @@ def check_marketplace(plugin_dirs: dict[str, Path]) -> list[str]:
     if not MARKETPLACE_JSON.exists():
         return [".claude-plugin/marketplace.json not found"]
 
-    marketplace = json.loads(MARKETPLACE_JSON.read_text())
+    marketplace = json.loads(MARKETPLACE_JSON.read_bytes())
 
     # Build a set of plugin directory names from marketplace sources
     listed_names: set[str] = set()
@@ -129,89 +168,136 @@ def check_marketplace(plugin_dirs: dict[str, Path]) -> list[str]:
 # --------------------------------------------------------------------------- #
 
 
-def extract_link_targets(file_path: Path) -> set[Path]:
-    """Return resolved filesystem paths from markdown links in a file."""
-    try:
-        content = file_path.read_text(encoding="utf-8")
-    except (UnicodeDecodeError, PermissionError):
-        return set()
+def read_files(files: list[str]) -> dict[str, bytes]:
+    """Read each file's bytes once, skipping files that can't be read."""
+    contents: dict[str, bytes] = {}
+    for f in files:
+        try:
+            with open(f, "rb") as fh:
+                contents[f] = fh.read()
+        except PermissionError:
+            continue
+    return contents
+
 
-    targets: set[Path] = set()
-    for match in MARKDOWN_LINK_RE.finditer(content):
-        raw = match.group(1)
-        # Strip anchor fragments
-        path_part = raw.split("#")[0]
+def extract_link_targets(file_path: str, content: str) -> set[str]:
+    """Return normalized filesystem paths from markdown links in a file's content.
 
-        if not path_part:
-            continue
+    Normalization is lexical (os.path.normpath), not Path.resolve(): targets
+    are only compared against normalized paths of files in the same tree, so
+    there's no need for a realpath lookup per link.
+    """
+    parent = os.path.dirname(file_path)
+    targets: set[str] = set()
+    for path_part in LINK_TARGET_RE.findall(content):
         if path_part.startswith(("http://", "https://", "mailto:", "data:")):
             continue
 
-        resolved = (file_path.parent / path_part).resolve()
-        targets.add(resolved)
+        targets.add(os.path.normpath(os.path.join(parent, path_part)))
 
     return targets
 
 
 def find_non_link_mentions(
-    filename: str, skill_dir: Path, all_files: list[Path]
-) -> list[Path]:
-    """Find files that mention a filename outside of a proper markdown link."""
-    mentioners: list[Path] = []
-    for f in all_files:
-        try:
-            content = f.read_text(encoding="utf-8")
-        except (UnicodeDecodeError, PermissionError):
-            continue
-        if filename not in content:
+    filename: str, contents: dict[str, bytes], stripped: dict[str, str | None]
+) -> list[str]:
+    """Find files that mention a filename outside of a proper markdown link.
+
+    Files are searched for the name as bytes first; only those containing it
+    are decoded and have their markdown links removed. That text is cached in
+    `stripped` (None for files that aren't UTF-8) across calls.
+    """
+    needle = filename.encode("utf-8")
+    mentioners: list[str] = []
+    for f, data in contents.items():
+        if needle not in data:
             continue
-        # Check it's not solely via markdown links — strip all markdown links
-        # and see if the filename still appears
-        stripped = MARKDOWN_LINK_RE.sub("", content)
-        if filename in stripped:
+        if f not in stripped:
+            try:
+                stripped[f] = MARKDOWN_LINK_RE.sub("", data.decode("utf-8"))
+            except UnicodeDecodeError:
+                stripped[f] = None
+        # Check it's not solely via markdown links
+        text = stripped[f]
+        if text is not None and filename in text:
             mentioners.append(f)
     return mentioners
 
 
-def check_file_references(skills: dict[str, Path]) -> list[str]:
-    """Verify every non-SKILL.md file in a skill dir is referenced by a markdown link."""
-    errors: list[str] = []
+def check_skill_file_references(skill_name: str, skill_dir: Path) -> tuple[list[str], int]:
+    """check_file_references for a single skill.
+
+    Returns (errors, number of non-SKILL.md markdown files checked).
 
-    for skill_name, skill_dir in sorted(skills.items()):
-        # Collect all files in the skill directory
-        all_files = [f for f in skill_dir.rglob("*") if f.is_file()]
+    Works on str paths throughout: this runs for every file in every skill,
+    and Path objects would only be built to be turned back into strings.
+    """
+    errors: list[str] = []
 
-        non_skill_md_files = [
-            f
-            for f in all_files
-            if f.name != "SKILL.md" and f.suffix == ".md"
-        ]
-        if not non_skill_md_files:
+    # Collect and classify all files in the skill directory in one pass
+    all_files = list(walk_files(skill_dir))
+    md_files: list[str] = []
+    non_skill_md_files: list[str] = []
+    for f in all_files:
+        if f.endswith(".md"):
+            md_files.append(f)
+            if os.path.basename(f) != "SKILL.md":
+                non_skill_md_files.append(f)
+    # Most skills are a lone SKILL.md (plus scripts): nothing to check, so
+    # return before sorting, reading or matching anything
+    if not non_skill_md_files:
+        return [], 0
+    all_files.sort(key=_path_sort_key)
+    non_skill_md_files.sort(key=_path_sort_key)
+
+    # Each file is read once, for both link targets and mentions
+    contents = read_files(all_files)
+
+    # Gather every link target from markdown files in this skill
+    all_referenced: set[str] = set()
+    for f in md_files:
+        try:
+            text = contents[f].decode("utf-8")
+        except (KeyError, UnicodeDecodeError):
             continue
+        all_referenced.update(extract_link_targets(f, text))
+
+    # Link-stripped text of files that mention an unreferenced file's name
+    stripped: dict[str, str | None] = {}
+
+    for f in non_skill_md_files:
+        if os.path.normpath(f) not in all_referenced:
+            rel = os.path.relpath(f, skill_dir)
+            # Search for non-link mentions (backticks, code blocks, plain text)
+            mentioned_in = find_non_link_mentions(os.path.basename(f), contents, stripped)
+            msg = (
+                f"'{rel}' in skill '{skill_name}' is not referenced "
+                f"by any markdown link within the skill"
+            )
+            if mentioned_in:
+                files_str = ", ".join(os.path.relpath(m, skill_dir) for m in mentioned_in)
+                msg += f" (but mentioned in: {files_str})"
+            errors.append(msg)
 
-        # Gather every link target from markdown files in this skill
-        md_files = [f for f in all_files if f.suffix == ".md"]
-        all_referenced: set[Path] = set()
-        for f in md_files:
-            all_referenced.update(extract_link_targets(f))
-
-        for f in sorted(non_skill_md_files):
-            if f.resolve() not in all_referenced:
-                rel = f.relative_to(skill_dir)
-                # Search for non-link mentions (backticks, code blocks, plain text)
-                mentioned_in = find_non_link_mentions(f.name, skill_dir, all_files)
-                msg = (
-                    f"'{rel}' in skill '{skill_name}' is not referenced "
-                    f"by any markdown link within the skill"
-                )
-                if mentioned_in:
-                    files_str = ", ".join(
-                        str(m.relative_to(skill_dir)) for m in mentioned_in
-                    )
-                    msg += f" (but mentioned in: {files_str})"
-                errors.append(msg)
+    return errors, len(non_skill_md_files)
 
-    return errors
+
+def check_file_references(skills: dict[str, Path]) -> tuple[list[str], int]:
+    """Verify every non-SKILL.md file in a skill dir is referenced by a markdown link.
+
+    Returns (errors, number of non-SKILL.md markdown files checked).
+    """
+    # Skills are independent and the work is mostly file reads, so check them
+    # concurrently; map() keeps the errors in skill order
+    all_errors: list[str] = []
+    md_count = 0
+    with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 4)) as executor:
+        for errors, count in executor.map(
+            lambda item: check_skill_file_references(*item), sorted(skills.items())
+        ):
+            all_errors.extend(errors)
+            md_count += count
+    return all_errors, md_count
 
 
 # --------------------------------------------------------------------------- #
@@ -219,6 +305,7 @@ def check_file_references(skills: dict[str, Path]) -> list[str]:
 # --------------------------------------------------------------------------- #
 
 
+@functools.cache
 def git_current_branch() -> str | None:
     result = subprocess.run(
         ["git", "rev-parse", "--abbrev-ref", "HEAD"],
@@ -229,6 +316,7 @@ def git_current_branch() -> str | None:
     return result.stdout.strip() if result.returncode == 0 else None
 
 
+@functools.cache
 def git_branch_exists(branch: str) -> bool:
     result = subprocess.run(
         ["git", "rev-parse", "--verify", branch],
@@ -239,7 +327,8 @@ def git_branch_exists(branch: str) -> bool:
     return result.returncode == 0
 
 
-def git_changed_files(base: str) -> set[str]:
+@functools.cache
+def git_changed_files(base: str) -> frozenset[str]:
     result = subprocess.run(
         ["git", "diff", "--name-only", f"{base}...HEAD"],
         capture_output=True,
@@ -247,24 +336,58 @@ def git_changed_files(base: str) -> set[str]:
         cwd=REPO_ROOT,
     )
     if result.returncode != 0:
-        return set()
-    return set(result.stdout.strip().splitlines())
+        return frozenset()
+    return frozenset(result.stdout.strip().splitlines())
 
 
-def git_file_at_ref(ref: str, path: str) -> str | None:
-    result = subprocess.run(
-        ["git", "show", f"{ref}:{path}"],
-        capture_output=True,
-        text=True,
-        cwd=REPO_ROOT,
-    )
-    return result.stdout if result.returncode == 0 else None
+class GitCatFile:
+    """A long-lived `git cat-file --batch` process for reading blobs at a ref.
+
+    Every lookup goes through the same process, so git loads the pack
+    indexes once rather than per file:
+
+        with GitCatFile() as cat:
+            content = cat.get("main", "path/to/file")
+    """
+
+    def __enter__(self) -> "GitCatFile":
+        self._proc = subprocess.Popen(
+            ["git", "cat-file", "--batch"],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            cwd=REPO_ROOT,
+        )
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self._proc.stdin.close()
+        self._proc.stdout.close()
+        self._proc.wait()
+
+    def get(self, ref: str, path: str) -> bytes | None:
+        """Raw content of `path` at `ref`, or None if it doesn't exist there."""
+        self._proc.stdin.write(f"{ref}:{path}\n".encode())
+        self._proc.stdin.flush()
+
+        # "<oid> <type> <size>\n<content>\n", or "<name> missing\n"
+        header = self._proc.stdout.readline().split()
+        if not header or header[-1] == b"missing":
+            return None
+        size = int(header[2])
+        content = self._proc.stdout.read(size)
+        self._proc.stdout.read(1)  # trailing newline
+        return content
 
 
 def check_version_increments(
-    plugin_dirs: dict[str, Path], base_branch: str
+    plugin_dirs: dict[str, Path], base_branch: str, use_worktree: bool = False
 ) -> list[str]:
-    """If skills changed vs. base branch, the plugin version must be bumped."""
+    """If skills changed vs. base branch, the plugin version must be bumped.
+
+    Skill changes are taken from the commits on HEAD, so the current version is
+    read from HEAD's plugin.json too, through the same git process as the base
+    version. With `use_worktree`, it's read from the working tree instead.
+    """
     errors: list[str] = []
 
     current = git_current_branch()
@@ -280,35 +403,42 @@ def check_version_increments(
     if not changed:
         return []
 
-    for plugin_name, plugin_dir in sorted(plugin_dirs.items()):
-        plugin_rel = str(plugin_dir.relative_to(REPO_ROOT))
-        skills_prefix = f"{plugin_rel}/skills/"
-        plugin_json_rel = f"{plugin_rel}/.claude-plugin/plugin.json"
-
-        skill_changes = sorted(f for f in changed if f.startswith(skills_prefix))
-        if not skill_changes:
-            continue
-
-        # Read current version
-        plugin_json_path = REPO_ROOT / plugin_json_rel
-        if not plugin_json_path.exists():
-            errors.append(f"Plugin '{plugin_name}': {plugin_json_rel} not found")
-            continue
-        current_version = json.loads(plugin_json_path.read_text()).get("version")
-
-        # Read base version
-        base_content = git_file_at_ref(base_branch, plugin_json_rel)
-        if base_content is None:
-            # Plugin is new — version check not applicable
-            continue
-        base_version = json.loads(base_content).get("version")
-
-        if current_version == base_version:
-            errors.append(
-                f"Plugin '{plugin_name}' has skill changes but version "
-                f"({current_version}) was not incremented in {plugin_json_rel}. "
-                f"Changed: {', '.join(skill_changes)}"
-            )
+    with GitCatFile() as cat:
+        for plugin_name, plugin_dir in sorted(plugin_dirs.items()):
+            plugin_rel = str(plugin_dir.relative_to(REPO_ROOT))
+            skills_prefix = f"{plugin_rel}/skills/"
+            plugin_json_rel = f"{plugin_rel}/.claude-plugin/plugin.json"
+
+            skill_changes = sorted(f for f in changed if f.startswith(skills_prefix))
+            if not skill_changes:
+                continue
+
+            # Read current version
+            if use_worktree:
+                try:
+                    current_content = (REPO_ROOT / plugin_json_rel).read_bytes()
+                except FileNotFoundError:
+                    current_content = None
+            else:
+                current_content = cat.get("HEAD", plugin_json_rel)
+            if current_content is None:
+                errors.append(f"Plugin '{plugin_name}': {plugin_json_rel} not found")
+                continue
+            current_version = json.loads(current_content).get("version")
+
+            # Read base version
+            base_content = cat.get(base_branch, plugin_json_rel)
+            if base_content is None:
+                # Plugin is new — version check not applicable
+                continue
+            base_version = json.loads(base_content).get("version")
+
+            if current_version == base_version:
+                errors.append(
+                    f"Plugin '{plugin_name}' has skill changes but version "
+                    f"({current_version}) was not incremented in {plugin_json_rel}. "
+                    f"Changed: {', '.join(skill_changes)}"
+                )
 
     return errors
 
@@ -325,46 +455,53 @@ def main() -> int:
         default="main",
         help="Branch to compare for version-increment check (default: main)",
     )
+    parser.add_argument(
+        "--use-worktree",
+        action="store_true",
+        help="Read current plugin versions from the working tree instead of HEAD",
+    )
     args = parser.parse_args()
 
     skills = find_all_skills()
     plugin_dirs = find_all_plugin_dirs()
     all_errors: list[str] = []
 
+    def file_references() -> tuple[list[str], str]:
+        # The check already walks every skill, so it reports the count too
+        errors, md_count = check_file_references(skills)
+        return errors, f"All {md_count} non-SKILL.md markdown files are properly referenced"
+
+    # Each check returns (errors, message to print if there are none)
     checks = [
         (
             "tile.json completeness",
-            lambda: check_tile_json(skills),
-            lambda: f"All {len(skills)} skills listed correctly",
+            lambda: (check_tile_json(skills), f"All {len(skills)} skills listed correctly"),
         ),
         (
             "marketplace.json completeness",
-            lambda: check_marketplace(plugin_dirs),
-            lambda: f"All {len(plugin_dirs)} plugin folders listed correctly",
-        ),
-        (
-            "File references within skills",
-            lambda: check_file_references(skills),
             lambda: (
-                f"All {sum(len([f for f in d.rglob('*') if f.is_file() and f.name != 'SKILL.md' and f.suffix == '.md']) for d in skills.values())} "
-                f"non-SKILL.md markdown files are properly referenced"
+                check_marketplace(plugin_dirs),
+                f"All {len(plugin_dirs)} plugin folders listed correctly",
             ),
         ),
+        ("File references within skills", file_references),
         (
             "Plugin version increments",
-            lambda: check_version_increments(plugin_dirs, args.base_branch),
-            lambda: "Plugin versions are up to date",
+            lambda: (
+                check_version_increments(plugin_dirs, args.base_branch, args.use_worktree),
+                "Plugin versions are up to date",
+            ),
         ),
     ]
 
-    for title, run_check, ok_msg in checks:
+    for title, run_check in checks:
         print(f"Checking {title}...")
-        errors = run_check()
+        errors, ok_msg = run_check()
         all_errors.extend(errors)
         for e in errors:
             print(f"  FAIL: {e}")
         if not errors:
-            print(f"  OK: {ok_msg()}")
+            print(f"  OK: {ok_msg}")
         print()
 
     if all_errors: